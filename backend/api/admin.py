@@ -2,7 +2,7 @@
 
 from django.contrib import admin
 from .models import (
-    UserProfile, Lesson, Quiz, Concept, 
+    UserProfile, Lesson, LessonContent, Quiz, QuizQuestions, Concept, ConceptRelation,
     LearningProgress, UserMastery, LearningSession
 )
 
@@ -12,19 +12,34 @@ class UserProfileAdmin(admin.ModelAdmin):
     list_filter = ['learning_style', 'preferred_difficulty', 'created_at']
     search_fields = ['user__username', 'user__email']
 
+class LessonContentInline(admin.StackedInline):
+    model = LessonContent
+    can_delete = False
+
 @admin.register(Lesson)
 class LessonAdmin(admin.ModelAdmin):
     list_display = ['title', 'difficulty_level', 'estimated_duration', 'is_published', 'created_at']
     list_filter = ['difficulty_level', 'is_published', 'created_at']
     search_fields = ['title', 'description']
     filter_horizontal = ['concepts', 'prerequisites']
+    inlines = [LessonContentInline]
+
+class ConceptRelationInline(admin.TabularInline):
+    model = ConceptRelation
+    fk_name = 'from_concept'
+    autocomplete_fields = ['to_concept']
+    extra = 1
 
 @admin.register(Concept)
 class ConceptAdmin(admin.ModelAdmin):
     list_display = ['name', 'category', 'difficulty_level', 'mastery_score', 'last_practiced']
     list_filter = ['category', 'difficulty_level']
     search_fields = ['name', 'description']
-    filter_horizontal = ['related_concepts']
+    inlines = [ConceptRelationInline]
+
+class QuizQuestionsInline(admin.StackedInline):
+    model = QuizQuestions
+    can_delete = False
 
 @admin.register(Quiz)
 class QuizAdmin(admin.ModelAdmin):
@@ -32,6 +47,7 @@ class QuizAdmin(admin.ModelAdmin):
     list_filter = ['difficulty_level', 'is_adaptive', 'created_at']
     search_fields = ['title', 'description']
     filter_horizontal = ['concepts']
+    inlines = [QuizQuestionsInline]
 
 @admin.register(LearningProgress)
 class LearningProgressAdmin(admin.ModelAdmin):
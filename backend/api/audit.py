@@ -0,0 +1,49 @@
+"""
+Buffered SystemLog writes for request handlers.
+
+Views queue entries with ``log_action`` inside ``transaction.atomic()``;
+they are written with a single bulk INSERT when that transaction commits,
+so a request that logs several actions costs one extra round-trip rather
+than one per entry, and nothing is logged for a mutation that rolled back.
+"""
+import logging
+from django.db import transaction
+
+from .models import SystemLog, touch_admin_dashboard
+
+logger = logging.getLogger(__name__)
+
+LOG_BATCH_SIZE = 500
+
+
+def flush_logs(request):
+    """Write the entries queued on ``request`` in one batched INSERT"""
+    entries = request.__dict__.pop('_system_log_buffer', None)
+    if not entries:
+        return
+    try:
+        SystemLog.objects.bulk_create(entries, batch_size=LOG_BATCH_SIZE)
+        # bulk_create sends no post_save, so refresh the dashboard here
+        touch_admin_dashboard()
+    except Exception as e:
+        # Audit logging is best-effort; the user-facing write already committed
+        logger.error(f"Failed to write {len(entries)} system log entries: {str(e)}")
+
+
+def log_action(request, log_type, message, severity='low', metadata=None):
+    """Queue a SystemLog entry attributed to ``request.user``"""
+    user = request.user if request.user.is_authenticated else None
+    entry = SystemLog(
+        log_type=log_type,
+        message=message,
+        user=user,
+        severity=severity,
+        metadata=metadata or {},
+    )
+    entries = request.__dict__.get('_system_log_buffer')
+    if entries is not None:
+        entries.append(entry)
+        return
+    request._system_log_buffer = [entry]
+    # Runs immediately when called outside an atomic block
+    transaction.on_commit(lambda: flush_logs(request))
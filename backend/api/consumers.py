@@ -1,22 +1,95 @@
 """
 WebSocket consumers for real-time communication.
 """
+import asyncio
 import json
 from channels.generic.websocket import AsyncWebsocketConsumer
 from channels.db import database_sync_to_async
 from django.contrib.auth.models import User
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+# Clients that offer this subprotocol receive binary MessagePack frames
+MSGPACK_SUBPROTOCOL = 'msgpack'
+
+# Notifications arriving within this window (seconds) share one frame
+NOTIFICATION_FLUSH_DELAY = 0.02
+
+# Fixed-shape outbound frames: the keys are literal ASCII, so only the
+# values need JSON encoding
+_CHAT_FRAME = '{{"message":{},"username":{}}}'
+_NOTIFICATION_FRAME = '{{"notification":{}}}'
+_NOTIFICATIONS_FRAME = '{{"notifications":{}}}'
+
+
+def json_loads(data):
+    """Decode a WebSocket JSON frame (str or bytes)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj):
+    """Encode a payload as a text WebSocket frame"""
+    if ORJSON_AVAILABLE:
+        # The frontend reads text frames, so decode the orjson bytes once
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
+
+
+def notification_group_name(user_id):
+    """Channel layer group a user's NotificationConsumers listen on"""
+    return f'notifications_{user_id}'
+
+
+def _parse_ws_params(query_string):
+    """Extract ``room`` and ``user_id`` from the raw (bytes) query string"""
+    room = 'general'
+    user_id = 'anonymous'
+    start = 0
+    end = len(query_string)
+    while start < end:
+        stop = query_string.find(b'&', start)
+        if stop == -1:
+            stop = end
+        if query_string.startswith(b'room=', start, stop):
+            room = query_string[start + 5:stop].decode()
+        elif query_string.startswith(b'user_id=', start, stop):
+            user_id = query_string[start + 8:stop].decode()
+        start = stop + 1
+    return room, user_id
+
 
 class ChatConsumer(AsyncWebsocketConsumer):
+    # Display name used for unauthenticated connections
+    ANONYMOUS_USERNAME = "Anonymous"
+
     async def connect(self):
         # Get parameters from query string
-        query_string = self.scope['query_string'].decode()
-        params = dict(x.split('=') for x in query_string.split('&') if '=' in x)
-        
-        self.room_name = params.get('room', 'general')
-        self.user_id = params.get('user_id', 'anonymous')
+        self.room_name, self.user_id = _parse_ws_params(self.scope['query_string'])
         self.room_group_name = f'chat_{self.room_name}'
 
+        # The user is fixed for the lifetime of the connection
+        user = self.scope["user"]
+        self.username = user.username if user.is_authenticated else self.ANONYMOUS_USERNAME
+
+        # Group payload builder with the username bound once per connection.
+        # The outbound frame is serialized once here, not once per group member.
+        self._make_payload = lambda message, username=self.username: {
+            'type': 'chat_message',
+            'frame': _CHAT_FRAME.format(json_dumps(message), json_dumps(username))
+        }
+
         # Join room group
         await self.channel_layer.group_add(
             self.room_group_name,
@@ -34,40 +107,36 @@ class ChatConsumer(AsyncWebsocketConsumer):
 
     # Receive message from WebSocket
     async def receive(self, text_data):
-        text_data_json = json.loads(text_data)
+        text_data_json = json_loads(text_data)
         message = text_data_json['message']
-        username = self.scope["user"].username if self.scope["user"].is_authenticated else "Anonymous"
 
         # Send message to room group
-        await self.channel_layer.group_send(
-            self.room_group_name,
-            {
-                'type': 'chat_message',
-                'message': message,
-                'username': username
-            }
-        )
+        await self.channel_layer.group_send(self.room_group_name, self._make_payload(message))
 
     # Receive message from room group
     async def chat_message(self, event):
-        message = event['message']
-        username = event['username']
+        # Forward the pre-serialized frame; build one for external producers
+        frame = event.get('frame')
+        if frame is None:
+            frame = _CHAT_FRAME.format(
+                json_dumps(event['message']),
+                json_dumps(event['username'])
+            )
 
         # Send message to WebSocket
-        await self.send(text_data=json.dumps({
-            'message': message,
-            'username': username
-        }))
+        await self.send(text_data=frame)
 
 
 class NotificationConsumer(AsyncWebsocketConsumer):
     async def connect(self):
         # Get parameters from query string
-        query_string = self.scope['query_string'].decode()
-        params = dict(x.split('=') for x in query_string.split('&') if '=' in x)
-        
-        self.user_id = params.get('user_id', 'anonymous')
-        self.room_group_name = f'notifications_{self.user_id}'
+        _, self.user_id = _parse_ws_params(self.scope['query_string'])
+        self.room_group_name = notification_group_name(self.user_id)
+
+        # Negotiate MessagePack framing; plain clients keep JSON text frames
+        self.use_msgpack = (
+            MSGPACK_AVAILABLE and MSGPACK_SUBPROTOCOL in self.scope.get('subprotocols', [])
+        )
 
         # Join room group
         await self.channel_layer.group_add(
@@ -75,9 +144,17 @@ class NotificationConsumer(AsyncWebsocketConsumer):
             self.channel_name
         )
 
-        await self.accept()
+        # Outbound queue for coalescing notification bursts
+        self._pending = []
+        self._flush_task = None
+
+        await self.accept(subprotocol=MSGPACK_SUBPROTOCOL if self.use_msgpack else None)
 
     async def disconnect(self, close_code):
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+
         # Leave room group
         await self.channel_layer.group_discard(
             self.room_group_name,
@@ -86,9 +163,31 @@ class NotificationConsumer(AsyncWebsocketConsumer):
 
     # Receive notification from room group
     async def send_notification(self, event):
-        notification = event['notification']
-
-        # Send notification to WebSocket
-        await self.send(text_data=json.dumps({
-            'notification': notification
-        }))
\ No newline at end of file
+        self._pending.append(event)
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(
+                self._flush_after(NOTIFICATION_FLUSH_DELAY)
+            )
+
+    async def _flush_after(self, delay):
+        await asyncio.sleep(delay)
+        pending, self._pending = self._pending, []
+        self._flush_task = None
+
+        # A lone notification keeps the original frame shape; forward the
+        # producer's pre-serialized frame when it sent one
+        if len(pending) == 1:
+            frame = pending[0].get('frame')
+            if frame is not None and not self.use_msgpack:
+                await self.send(text_data=frame)
+                return
+            key, value, template = 'notification', pending[0]['notification'], _NOTIFICATION_FRAME
+        else:
+            key, value = 'notifications', [event['notification'] for event in pending]
+            template = _NOTIFICATIONS_FRAME
+
+        # Send notification(s) to WebSocket
+        if self.use_msgpack:
+            await self.send(bytes_data=msgpack.packb({key: value}, use_bin_type=True))
+        else:
+            await self.send(text_data=template.format(json_dumps(value)))
\ No newline at end of file
@@ -0,0 +1,54 @@
+"""
+Custom model fields for Jeseci Interactive Learning Platform
+"""
+import binascii
+from base64 import b64decode, b64encode
+
+import msgpack
+from django import forms
+from django.core.exceptions import ValidationError
+from django.db import models
+
+
+class MsgpackField(models.BinaryField):
+    """Store JSON-compatible Python data as a compact MessagePack blob
+
+    Used for append-heavy or write-mostly structures that are never
+    filtered on in the database; keep JSONField where key lookups are needed.
+    """
+    description = 'MessagePack-encoded data'
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('editable', True)
+        super().__init__(*args, **kwargs)
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return msgpack.unpackb(value, raw=False)
+
+    def to_python(self, value):
+        try:
+            if isinstance(value, (bytes, bytearray, memoryview)):
+                return msgpack.unpackb(value, raw=False)
+            if isinstance(value, str):
+                # Serialized (dumpdata/loaddata) form is base64 text
+                return msgpack.unpackb(b64decode(value.encode('ascii')), raw=False)
+        except (binascii.Error, ValueError, msgpack.exceptions.UnpackException) as e:
+            raise ValidationError(
+                'Value is not valid MessagePack data: %(error)s',
+                code='invalid', params={'error': e},
+            )
+        return value
+
+    def get_prep_value(self, value):
+        if value is None or isinstance(value, (bytes, bytearray, memoryview)):
+            return value
+        return msgpack.packb(value, use_bin_type=True)
+
+    def formfield(self, **kwargs):
+        # Forms (the admin included) edit the decoded value as JSON text
+        return super().formfield(**{'form_class': forms.JSONField, **kwargs})
+
+    def value_to_string(self, obj):
+        return b64encode(self.get_prep_value(self.value_from_object(obj))).decode('ascii')
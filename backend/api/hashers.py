@@ -0,0 +1,15 @@
+"""
+Password hashers for the API application
+"""
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """Argon2id at the OWASP baseline cost: 46 MiB, 2 passes, 1 lane
+
+    Keeps Django's ``argon2`` algorithm name, so hashes made with other
+    parameters still verify and are re-hashed on the next login.
+    """
+    memory_cost = 47104  # KiB
+    time_cost = 2
+    parallelism = 1
@@ -0,0 +1,38 @@
+"""
+Django management command to rebuild the daily lesson analytics rollup
+"""
+import logging
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from api.models import LearningProgress, LessonDailyRollup
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Rebuild LessonDailyRollup from LearningProgress (backfill or repair)'
+
+    def handle(self, *args, **options):
+        """Recompute every rollup row with two GROUP BY queries
+
+        LessonDailyRollup.aggregate_progress is also what the progress signals
+        recount single days with, so the two always agree.
+        """
+        self.stdout.write('📊 Rebuilding lesson analytics rollup...')
+
+        rows = LessonDailyRollup.aggregate_progress(LearningProgress.objects.all())
+
+        with transaction.atomic():
+            LessonDailyRollup.objects.all().delete()
+            LessonDailyRollup.objects.bulk_create(
+                [
+                    LessonDailyRollup(lesson_id=lesson_id, day=day, **counters)
+                    for (lesson_id, day), counters in rows.items()
+                ],
+                batch_size=1000,
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(f'✅ Rebuilt {len(rows)} rollup rows')
+        )
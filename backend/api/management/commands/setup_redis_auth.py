@@ -2,13 +2,21 @@
 Django management command to configure Redis authentication
 """
 import os
+import re
 import subprocess
+import tempfile
 import logging
+from pathlib import Path
 from django.core.management.base import BaseCommand
 from django.conf import settings
 
 logger = logging.getLogger(__name__)
 
+# Keep in sync with CELERY_REDIS_MAX_CONNECTIONS in settings
+REDIS_MAX_CONNECTIONS = 100
+
+REDIS_PASSWORD_RE = re.compile(r'^REDIS_PASSWORD=.*$', re.MULTILINE)
+
 class Command(BaseCommand):
     help = 'Configure Redis authentication for Celery'
 
@@ -71,29 +79,34 @@ class Command(BaseCommand):
 
     def save_redis_password_to_env(self, env_file, password):
         """Save Redis password to .env file"""
-        env_content = []
+        env_path = Path(env_file)
         
         # Read existing .env or create new
-        if os.path.exists(env_file):
-            with open(env_file, 'r') as f:
-                env_content = f.readlines()
+        content = env_path.read_text() if env_path.exists() else ''
         
         # Update or add REDIS_PASSWORD
-        password_line = f'REDIS_PASSWORD={password}\\n'
-        found_password = False
-        
-        for i, line in enumerate(env_content):
-            if line.startswith('REDIS_PASSWORD='):
-                env_content[i] = password_line
-                found_password = True
-                break
-        
-        if not found_password:
-            env_content.append(password_line)
+        password_line = f'REDIS_PASSWORD={password}'
+        if REDIS_PASSWORD_RE.search(content):
+            # Callable replacement so backslashes in the password stay literal
+            content = REDIS_PASSWORD_RE.sub(lambda m: password_line, content, count=1)
+        elif content:
+            content = content.rstrip('\n') + '\n' + password_line + '\n'
+        else:
+            content = password_line + '\n'
         
-        # Write back to file
-        with open(env_file, 'w') as f:
-            f.writelines(env_content)
+        # Write to a temp file in the same directory and swap it in atomically,
+        # so a crash never leaves a truncated .env behind
+        with tempfile.NamedTemporaryFile(
+            'w', dir=env_path.parent, prefix='.env.', delete=False
+        ) as tmp:
+            tmp.write(content)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        try:
+            os.replace(tmp.name, env_path)
+        except OSError:
+            os.unlink(tmp.name)
+            raise
         
         self.stdout.write(f'💾 Saved password to {env_file}')
 
@@ -101,8 +114,20 @@ class Command(BaseCommand):
         """Test Redis connection with new password"""
         try:
             import redis
-            r = redis.Redis(host='localhost', port=6379, password=password, decode_responses=True)
-            r.ping()
+            # Pooled client (same shape Celery uses); redis-py picks the
+            # hiredis parser automatically when it is installed
+            pool = redis.ConnectionPool(
+                host='localhost',
+                port=6379,
+                password=password,
+                decode_responses=True,
+                max_connections=REDIS_MAX_CONNECTIONS,
+            )
+            r = redis.Redis(connection_pool=pool)
+            try:
+                r.ping()
+            finally:
+                pool.disconnect()
             self.stdout.write('✅ Redis connection test successful!')
         except Exception as e:
             self.stdout.write(
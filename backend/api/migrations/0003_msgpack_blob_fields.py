@@ -0,0 +1,75 @@
+# Moves write-mostly JSON columns to MessagePack blobs
+
+import api.fields
+from django.db import migrations
+
+
+PACKED_FIELDS = [
+    ('aiagent', 'config', dict),
+    ('learningsession', 'interactions', list),
+    ('learningsession', 'performance_data', dict),
+    ('systemlog', 'metadata', dict),
+    ('usermastery', 'assessment_history', list),
+]
+
+
+def _copy_fields(apps, source_suffix, target_suffix):
+    models_fields = {}
+    for model_name, field_name, _ in PACKED_FIELDS:
+        models_fields.setdefault(model_name, []).append(field_name)
+
+    for model_name, field_names in models_fields.items():
+        model = apps.get_model('api', model_name)
+        targets = [f'{name}{target_suffix}' for name in field_names]
+        batch = []
+        for obj in model.objects.only('pk', *[f'{name}{source_suffix}' for name in field_names]).iterator():
+            for name in field_names:
+                setattr(obj, f'{name}{target_suffix}', getattr(obj, f'{name}{source_suffix}'))
+            batch.append(obj)
+            if len(batch) >= 500:
+                model.objects.bulk_update(batch, targets)
+                batch = []
+        if batch:
+            model.objects.bulk_update(batch, targets)
+
+
+def pack_fields(apps, schema_editor):
+    _copy_fields(apps, '', '_packed')
+
+
+def unpack_fields(apps, schema_editor):
+    _copy_fields(apps, '_packed', '')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_achievement_aiagent_badge_systemhealth_systemlog_and_more'),
+    ]
+
+    operations = [
+        *[
+            migrations.AddField(
+                model_name=model_name,
+                name=f'{field_name}_packed',
+                field=api.fields.MsgpackField(default=default, editable=True),
+            )
+            for model_name, field_name, default in PACKED_FIELDS
+        ],
+        migrations.RunPython(pack_fields, unpack_fields),
+        *[
+            migrations.RemoveField(
+                model_name=model_name,
+                name=field_name,
+            )
+            for model_name, field_name, _ in PACKED_FIELDS
+        ],
+        *[
+            migrations.RenameField(
+                model_name=model_name,
+                old_name=f'{field_name}_packed',
+                new_name=field_name,
+            )
+            for model_name, field_name, _ in PACKED_FIELDS
+        ],
+    ]
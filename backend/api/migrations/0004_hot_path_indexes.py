@@ -0,0 +1,70 @@
+# Generated by Django 5.2.8 on 2026-10-16 11:57
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_msgpack_blob_fields'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='aiagent',
+            name='status',
+            field=models.CharField(choices=[('idle', 'Idle'), ('busy', 'Busy'), ('active', 'Active'), ('error', 'Error'), ('offline', 'Offline')], db_index=True, default='offline', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='learningprogress',
+            name='status',
+            field=models.CharField(choices=[('not_started', 'Not Started'), ('in_progress', 'In Progress'), ('completed', 'Completed'), ('paused', 'Paused')], db_index=True, default='not_started', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='learningsession',
+            name='session_type',
+            field=models.CharField(choices=[('lesson', 'Lesson Study'), ('quiz', 'Quiz Taking'), ('practice', 'Practice Session'), ('review', 'Review Session')], db_index=True, max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name='learningprogress',
+            index=models.Index(fields=['-updated_at'], name='progress_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='learningprogress',
+            index=models.Index(fields=['user', '-updated_at'], name='progress_user_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='learningsession',
+            index=models.Index(fields=['user', '-start_time'], name='session_user_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='systemhealth',
+            index=models.Index(fields=['-timestamp'], name='system_health_ts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='systemlog',
+            index=models.Index(fields=['-timestamp', 'log_type'], name='system_log_ts_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userachievement',
+            index=models.Index(fields=['-updated_at'], name='user_ach_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userachievement',
+            index=models.Index(fields=['user', '-updated_at'], name='user_ach_user_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userbadge',
+            index=models.Index(fields=['user', '-earned_at'], name='user_badge_user_earned_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='usermastery',
+            index=models.Index(fields=['-updated_at'], name='mastery_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='usermastery',
+            index=models.Index(fields=['user', '-updated_at'], name='mastery_user_updated_idx'),
+        ),
+    ]
@@ -0,0 +1,82 @@
+# Generated by Django 5.2.8 on 2026-10-16 11:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def copy_relations(apps, schema_editor):
+    """Copy the symmetric M2M rows, materialising both directions as edges"""
+    Concept = apps.get_model('api', 'Concept')
+    ConceptRelation = apps.get_model('api', 'ConceptRelation')
+    AutoThrough = Concept.related_concepts.through
+    edges = set()
+    for row in AutoThrough.objects.all().iterator():
+        edges.add((row.from_concept_id, row.to_concept_id))
+        edges.add((row.to_concept_id, row.from_concept_id))
+    ConceptRelation.objects.bulk_create(
+        [
+            ConceptRelation(from_concept_id=from_id, to_concept_id=to_id)
+            for from_id, to_id in edges
+        ],
+        batch_size=500,
+        ignore_conflicts=True,
+    )
+
+
+def restore_relations(apps, schema_editor):
+    Concept = apps.get_model('api', 'Concept')
+    ConceptRelation = apps.get_model('api', 'ConceptRelation')
+    AutoThrough = Concept.related_concepts.through
+    AutoThrough.objects.bulk_create(
+        [
+            AutoThrough(from_concept_id=rel.from_concept_id, to_concept_id=rel.to_concept_id)
+            for rel in ConceptRelation.objects.all().iterator()
+        ],
+        batch_size=500,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ConceptRelation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('weight', models.FloatField(default=1.0)),
+                ('from_concept', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='outgoing_relations', to='api.concept')),
+                ('to_concept', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='incoming_relations', to='api.concept')),
+            ],
+            options={
+                'db_table': 'concept_relation',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='conceptrelation',
+            index=models.Index(fields=['from_concept', 'weight'], name='concept_rel_from_weight_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='conceptrelation',
+            index=models.Index(fields=['to_concept', 'weight'], name='concept_rel_to_weight_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='conceptrelation',
+            unique_together={('from_concept', 'to_concept')},
+        ),
+        migrations.RunPython(copy_relations, restore_relations),
+        # Django cannot alter an M2M to add ``through``, so swap the field
+        migrations.RemoveField(
+            model_name='concept',
+            name='related_concepts',
+        ),
+        migrations.AddField(
+            model_name='concept',
+            name='related_concepts',
+            field=models.ManyToManyField(blank=True, related_name='related_from', through='api.ConceptRelation', to='api.concept'),
+        ),
+    ]
@@ -0,0 +1,168 @@
+# Switches LearningSession and SystemLog from random UUID primary keys to
+# sequential BIGINT keys. A UUID primary key cannot be altered in place on
+# every backend, so each table is rebuilt: the old UUID becomes public_id.
+
+import api.fields
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+SESSION_TYPES = [
+    ('lesson', 'Lesson Study'),
+    ('quiz', 'Quiz Taking'),
+    ('practice', 'Practice Session'),
+    ('review', 'Review Session'),
+]
+
+LOG_TYPES = [
+    ('user_registration', 'User Registration'),
+    ('path_completion', 'Path Completion'),
+    ('module_completion', 'Module Completion'),
+    ('agent_action', 'Agent Action'),
+    ('system_alert', 'System Alert'),
+    ('login', 'User Login'),
+    ('logout', 'User Logout'),
+    ('quiz_completion', 'Quiz Completion'),
+]
+
+SEVERITY_LEVELS = [
+    ('low', 'Low'),
+    ('medium', 'Medium'),
+    ('high', 'High'),
+    ('critical', 'Critical'),
+]
+
+SESSION_COPY_FIELDS = [
+    'user_id', 'session_type', 'content_id', 'content_title', 'start_time',
+    'end_time', 'duration_minutes', 'interactions', 'performance_data',
+]
+
+LOG_COPY_FIELDS = ['log_type', 'message', 'user_id', 'severity', 'metadata', 'timestamp']
+
+
+def _copy_rows(source, target, fields, source_pk, target_pk):
+    # Oldest first so the new sequential IDs follow insertion order
+    ordering = 'start_time' if 'start_time' in fields else 'timestamp'
+    batch = []
+    for row in source.objects.order_by(ordering).iterator():
+        obj = target(**{field: getattr(row, field) for field in fields})
+        setattr(obj, target_pk, getattr(row, source_pk))
+        batch.append(obj)
+        if len(batch) >= 500:
+            target.objects.bulk_create(batch)
+            batch = []
+    if batch:
+        target.objects.bulk_create(batch)
+
+
+def copy_forwards(apps, schema_editor):
+    _copy_rows(
+        apps.get_model('api', 'LearningSession'), apps.get_model('api', 'LearningSessionNew'),
+        SESSION_COPY_FIELDS, 'id', 'public_id',
+    )
+    _copy_rows(
+        apps.get_model('api', 'SystemLog'), apps.get_model('api', 'SystemLogNew'),
+        LOG_COPY_FIELDS, 'id', 'public_id',
+    )
+
+
+def copy_backwards(apps, schema_editor):
+    LearningSession = apps.get_model('api', 'LearningSession')
+    SystemLog = apps.get_model('api', 'SystemLog')
+    # auto_now_add would overwrite the copied timestamps on bulk_create
+    LearningSession._meta.get_field('start_time').auto_now_add = False
+    SystemLog._meta.get_field('timestamp').auto_now_add = False
+    _copy_rows(
+        apps.get_model('api', 'LearningSessionNew'), LearningSession,
+        SESSION_COPY_FIELDS, 'public_id', 'id',
+    )
+    _copy_rows(
+        apps.get_model('api', 'SystemLogNew'), SystemLog,
+        LOG_COPY_FIELDS, 'public_id', 'id',
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_concept_relation'),
+        ('contenttypes', '0002_remove_content_type_name'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LearningSessionNew',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('public_id', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('session_type', models.CharField(choices=SESSION_TYPES, db_index=True, max_length=20)),
+                ('content_id', models.UUIDField()),
+                ('content_title', models.CharField(max_length=200)),
+                ('start_time', models.DateTimeField()),
+                ('end_time', models.DateTimeField(blank=True, null=True)),
+                ('duration_minutes', models.IntegerField(default=0)),
+                ('interactions', api.fields.MsgpackField(default=list, editable=True)),
+                ('performance_data', api.fields.MsgpackField(default=dict, editable=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'learning_session_new',
+            },
+        ),
+        migrations.CreateModel(
+            name='SystemLogNew',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('public_id', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('log_type', models.CharField(choices=LOG_TYPES, max_length=30)),
+                ('message', models.TextField()),
+                ('severity', models.CharField(choices=SEVERITY_LEVELS, default='low', max_length=20)),
+                ('metadata', api.fields.MsgpackField(default=dict, editable=True)),
+                ('timestamp', models.DateTimeField()),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'system_log_new',
+            },
+        ),
+        migrations.RunPython(copy_forwards, copy_backwards),
+        migrations.DeleteModel(name='LearningSession'),
+        migrations.DeleteModel(name='SystemLog'),
+        migrations.RenameModel(old_name='LearningSessionNew', new_name='LearningSession'),
+        migrations.RenameModel(old_name='SystemLogNew', new_name='SystemLog'),
+        migrations.AlterModelTable(name='learningsession', table='learning_session'),
+        migrations.AlterModelTable(name='systemlog', table='system_log'),
+        migrations.AlterModelOptions(name='learningsession', options={'ordering': ['-start_time']}),
+        migrations.AlterModelOptions(name='systemlog', options={'ordering': ['-timestamp']}),
+        migrations.AlterField(
+            model_name='learningsession',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sessions', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='systemlog',
+            name='user',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='learningsession',
+            name='start_time',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.AlterField(
+            model_name='systemlog',
+            name='timestamp',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.AddIndex(
+            model_name='learningsession',
+            index=models.Index(fields=['user', '-start_time'], name='session_user_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='systemlog',
+            index=models.Index(fields=['-timestamp', 'log_type'], name='system_log_ts_type_idx'),
+        ),
+    ]
@@ -0,0 +1,86 @@
+# Moves Lesson.content and Quiz.questions into 1:1 side tables
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def split_payloads(apps, schema_editor):
+    Lesson = apps.get_model('api', 'Lesson')
+    Quiz = apps.get_model('api', 'Quiz')
+    LessonContent = apps.get_model('api', 'LessonContent')
+    QuizQuestions = apps.get_model('api', 'QuizQuestions')
+    LessonContent.objects.bulk_create(
+        (LessonContent(lesson_id=pk, content=content)
+         for pk, content in Lesson.objects.values_list('pk', 'content').iterator()),
+        batch_size=500,
+    )
+    QuizQuestions.objects.bulk_create(
+        (QuizQuestions(quiz_id=pk, questions=questions)
+         for pk, questions in Quiz.objects.values_list('pk', 'questions').iterator()
+         if questions is not None),
+        batch_size=500,
+    )
+
+
+def merge_payloads(apps, schema_editor):
+    Lesson = apps.get_model('api', 'Lesson')
+    Quiz = apps.get_model('api', 'Quiz')
+    LessonContent = apps.get_model('api', 'LessonContent')
+    QuizQuestions = apps.get_model('api', 'QuizQuestions')
+    for lesson_id, content in LessonContent.objects.values_list('lesson_id', 'content').iterator():
+        Lesson.objects.filter(pk=lesson_id).update(content=content)
+    for quiz_id, questions in QuizQuestions.objects.values_list('quiz_id', 'questions').iterator():
+        Quiz.objects.filter(pk=quiz_id).update(questions=questions)
+    # Rows without a side-table entry get an empty payload before NOT NULL is restored
+    Lesson.objects.filter(content__isnull=True).update(content='')
+    Quiz.objects.filter(questions__isnull=True).update(questions=[])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_sequential_log_session_pks'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LessonContent',
+            fields=[
+                ('lesson', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='body', serialize=False, to='api.lesson')),
+                ('content', models.TextField()),
+            ],
+            options={
+                'db_table': 'lesson_content',
+            },
+        ),
+        migrations.CreateModel(
+            name='QuizQuestions',
+            fields=[
+                ('quiz', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='body', serialize=False, to='api.quiz')),
+                ('questions', models.JSONField()),
+            ],
+            options={
+                'db_table': 'quiz_questions',
+            },
+        ),
+        # Nullable while the payloads move so the reverse path can re-add the columns
+        migrations.AlterField(
+            model_name='lesson',
+            name='content',
+            field=models.TextField(null=True),
+        ),
+        migrations.AlterField(
+            model_name='quiz',
+            name='questions',
+            field=models.JSONField(null=True),
+        ),
+        migrations.RunPython(split_payloads, merge_payloads),
+        migrations.RemoveField(
+            model_name='lesson',
+            name='content',
+        ),
+        migrations.RemoveField(
+            model_name='quiz',
+            name='questions',
+        ),
+    ]
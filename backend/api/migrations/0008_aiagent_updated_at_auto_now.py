@@ -0,0 +1,30 @@
+# Generated by Django 5.2.8 on 2026-10-16 12:03
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def touch_updated_at(apps, schema_editor):
+    # Existing values are just creation times; reset them so ordering is meaningful
+    AIAgent = apps.get_model('api', 'AIAgent')
+    AIAgent.objects.update(updated_at=timezone.now())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_split_lesson_quiz_payloads'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='aiagent',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.RunPython(touch_updated_at, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='aiagent',
+            index=models.Index(fields=['-updated_at'], name='ai_agent_updated_idx'),
+        ),
+    ]
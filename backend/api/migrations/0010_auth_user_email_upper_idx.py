@@ -0,0 +1,33 @@
+# Functional index backing case-insensitive email lookups (email__iexact)
+# on the built-in auth_user table, which this app cannot declare in Meta
+
+from django.db import migrations
+
+INDEX_NAME = 'auth_user_email_upper_idx'
+# PostgreSQL compiles email__iexact to UPPER(email) = UPPER(%s), which this
+# index serves. SQLite compiles it to LIKE ... ESCAPE, which cannot use it.
+SUPPORTED_VENDORS = ('postgresql',)
+
+
+def create_index(apps, schema_editor):
+    if schema_editor.connection.vendor in SUPPORTED_VENDORS:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON auth_user (UPPER(email))'
+        )
+
+
+def drop_index(apps, schema_editor):
+    if schema_editor.connection.vendor in SUPPORTED_VENDORS:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {INDEX_NAME}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_lesson_created_by'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.8 on 2026-10-16 12:11
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_auth_user_email_upper_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LessonDailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('enrollments', models.IntegerField(default=0)),
+                ('completions', models.IntegerField(default=0)),
+                ('score_total', models.FloatField(default=0.0)),
+                ('score_count', models.IntegerField(default=0)),
+                ('time_spent_total', models.IntegerField(default=0, help_text='Minutes spent by completing learners')),
+                ('lesson', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_rollups', to='api.lesson')),
+            ],
+            options={
+                'db_table': 'lesson_daily_rollup',
+                'ordering': ['-day'],
+                'unique_together': {('lesson', 'day')},
+            },
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.8 on 2026-10-16 12:57
+
+from django.db import migrations, models
+
+
+def mirror_relations(apps, schema_editor):
+    """Add the reverse edge for relations saved one-way since 0005"""
+    ConceptRelation = apps.get_model('api', 'ConceptRelation')
+    ConceptRelation.objects.bulk_create(
+        [
+            ConceptRelation(
+                from_concept_id=rel.to_concept_id,
+                to_concept_id=rel.from_concept_id,
+                weight=rel.weight,
+            )
+            for rel in ConceptRelation.objects.all().iterator()
+        ],
+        batch_size=500,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_lesson_daily_rollup'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='concept',
+            name='related_concepts',
+            field=models.ManyToManyField(blank=True, through='api.ConceptRelation', to='api.concept'),
+        ),
+        # Rows from 0005 are already paired; ignore_conflicts skips them
+        migrations.RunPython(mirror_relations, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 5.2.8 on 2026-10-16 13:10
+
+from django.db import migrations
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
+
+
+def backfill_rollup(apps, schema_editor):
+    """Count existing progress rows into the rollup, as rebuild_learning_rollups does
+
+    Historical models have no methods, so this repeats
+    LessonDailyRollup.aggregate_progress. Completed rows saved before the
+    signals stamped completed_at get their last update time, so they are
+    counted on a day too.
+    """
+    LearningProgress = apps.get_model('api', 'LearningProgress')
+    LessonDailyRollup = apps.get_model('api', 'LessonDailyRollup')
+
+    LearningProgress.objects.filter(status='completed', completed_at__isnull=True).update(
+        completed_at=F('updated_at')
+    )
+
+    rows = {}
+    for row in (
+        LearningProgress.objects.annotate(day=TruncDate('created_at'))
+        .values('lesson_id', 'day')
+        .annotate(enrollments=Count('id'))
+    ):
+        rows.setdefault((row['lesson_id'], row['day']), {})['enrollments'] = row['enrollments']
+    for row in (
+        LearningProgress.objects.filter(status='completed', completed_at__isnull=False)
+        .annotate(day=TruncDate('completed_at'))
+        .values('lesson_id', 'day')
+        .annotate(
+            completions=Count('id'),
+            time_spent_total=Sum('time_spent'),
+            score_total=Sum('quiz_score'),
+            score_count=Count('quiz_score'),
+        )
+    ):
+        rows.setdefault((row['lesson_id'], row['day']), {}).update(
+            completions=row['completions'],
+            time_spent_total=row['time_spent_total'] or 0,
+            score_total=row['score_total'] or 0.0,
+            score_count=row['score_count'],
+        )
+
+    LessonDailyRollup.objects.all().delete()
+    LessonDailyRollup.objects.bulk_create(
+        [
+            LessonDailyRollup(lesson_id=lesson_id, day=day, **counters)
+            for (lesson_id, day), counters in rows.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0012_symmetric_concept_relations'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_rollup, migrations.RunPython.noop),
+    ]
@@ -4,11 +4,61 @@ Django Models for Jeseci Interactive Learning Platform
 Database models for user management, learning content, and progress tracking.
 """
 import uuid
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
 
+from .fields import MsgpackField
+
+RELATED_CONCEPTS_CACHE_TIMEOUT = 60 * 60  # 1 hour
+ACTIVE_AGENTS_CACHE_TIMEOUT = 15  # seconds; health dashboards poll frequently
+ADMIN_STATS_CACHE_KEY = 'admin:stats:v1'
+ADMIN_STATS_CACHE_TIMEOUT = 30  # seconds; the admin dashboard polls every few seconds
+ADMIN_DASHBOARD_VERSION_KEY = 'admin:dashboard:version'
+ADMIN_AGENTS_CACHE_KEY = 'admin:agents:v1'
+ADMIN_AGENTS_CACHE_TIMEOUT = 15  # seconds; agent status changes often
+ACHIEVEMENTS_CACHE_KEY = 'achievements:catalog:v1'
+ACHIEVEMENTS_CACHE_TIMEOUT = 5 * 60  # 5 minutes; the catalog rarely changes
+
+
+def admin_dashboard_version():
+    """Opaque token that changes whenever admin dashboard data is written"""
+    return cache.get_or_set(ADMIN_DASHBOARD_VERSION_KEY, lambda: uuid.uuid4().hex, None)
+
+
+def touch_admin_dashboard():
+    """Drop the cached admin statistics and move the dashboard to a new version"""
+    cache.delete(ADMIN_STATS_CACHE_KEY)
+    cache.set(ADMIN_DASHBOARD_VERSION_KEY, uuid.uuid4().hex, None)
+
+
+class SelectRelatedManager(models.Manager):
+    """Manager that joins the model's foreign keys up front
+
+    Installed as ``with_related`` next to a plain default manager, so only()
+    and defer() keep working on ``objects`` and counts pay for no joins.
+    """
+    related_fields = ()
+    
+    def get_queryset(self):
+        return super().get_queryset().select_related(*self.related_fields)
+
+class LearningProgressManager(SelectRelatedManager):
+    related_fields = ('user', 'lesson')
+
+class UserMasteryManager(SelectRelatedManager):
+    related_fields = ('user', 'concept')
+
+class UserAchievementManager(SelectRelatedManager):
+    related_fields = ('user', 'achievement')
+
+class UserBadgeManager(SelectRelatedManager):
+    related_fields = ('user', 'badge')
+
 class UserProfile(models.Model):
     """Extended user profile for learning preferences"""
     LEARNING_STYLES = [
@@ -59,7 +109,15 @@ class Concept(models.Model):
     description = models.TextField()
     category = models.CharField(max_length=50, choices=CATEGORIES)
     difficulty_level = models.CharField(max_length=20, choices=DIFFICULTY_LEVELS)
-    related_concepts = models.ManyToManyField('self', symmetrical=True, blank=True)
+    # Symmetric like the plain M2M it replaced: add() and remove() write both
+    # edge rows, and the mirror_concept_relation signal keeps direct
+    # ConceptRelation saves in step
+    related_concepts = models.ManyToManyField(
+        'self',
+        through='ConceptRelation',
+        symmetrical=True,
+        blank=True
+    )
     mastery_score = models.FloatField(
         default=0.0,
         validators=[MinValueValidator(0.0), MaxValueValidator(1.0)]
@@ -71,10 +129,43 @@ class Concept(models.Model):
     def __str__(self):
         return self.name
     
+    @staticmethod
+    def related_cache_key(concept_id):
+        return f'concept:{concept_id}:related'
+    
+    def get_related_concept_ids(self):
+        """Related concept IDs ordered by relation weight (cached)"""
+        cache_key = self.related_cache_key(self.pk)
+        related_ids = cache.get(cache_key)
+        if related_ids is None:
+            related_ids = [
+                str(concept_id) for concept_id in
+                self.outgoing_relations.order_by('-weight').values_list('to_concept_id', flat=True)
+            ]
+            cache.set(cache_key, related_ids, RELATED_CONCEPTS_CACHE_TIMEOUT)
+        return related_ids
+    
     class Meta:
         db_table = 'concept'
         ordering = ['name']
 
+class ConceptRelation(models.Model):
+    """Weighted, directed edge between two related concepts"""
+    from_concept = models.ForeignKey(Concept, on_delete=models.CASCADE, related_name='outgoing_relations')
+    to_concept = models.ForeignKey(Concept, on_delete=models.CASCADE, related_name='incoming_relations')
+    weight = models.FloatField(default=1.0)
+    
+    def __str__(self):
+        return f"{self.from_concept_id} -> {self.to_concept_id}"
+    
+    class Meta:
+        db_table = 'concept_relation'
+        unique_together = ['from_concept', 'to_concept']
+        indexes = [
+            models.Index(fields=['from_concept', 'weight'], name='concept_rel_from_weight_idx'),
+            models.Index(fields=['to_concept', 'weight'], name='concept_rel_to_weight_idx'),
+        ]
+
 class Lesson(models.Model):
     """Individual learning lessons"""
     DIFFICULTY_LEVELS = [
@@ -86,12 +177,14 @@ class Lesson(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     title = models.CharField(max_length=200)
     description = models.TextField()
-    content = models.TextField()  # Rich content including code examples
     difficulty_level = models.CharField(max_length=20, choices=DIFFICULTY_LEVELS)
     estimated_duration = models.IntegerField(help_text='Estimated duration in minutes')
     concepts = models.ManyToManyField(Concept, related_name='lessons')
     prerequisites = models.ManyToManyField('self', symmetrical=False, blank=True)
     is_published = models.BooleanField(default=False)
+    created_by = models.ForeignKey(
+        User, on_delete=models.SET_NULL, null=True, blank=True, related_name='created_lessons'
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -121,7 +214,6 @@ class Quiz(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     title = models.CharField(max_length=200)
     description = models.TextField()
-    questions = models.JSONField()  # Dynamic questions structure
     concepts = models.ManyToManyField(Concept, related_name='quizzes')
     difficulty_level = models.CharField(max_length=20, choices=DIFFICULTY_LEVELS)
     time_limit = models.IntegerField(null=True, blank=True, help_text='Time limit in minutes')
@@ -136,6 +228,29 @@ class Quiz(models.Model):
         db_table = 'quiz'
         ordering = ['title']
 
+# Heavy payloads live in 1:1 side tables so list queries only read the narrow row
+class LessonContent(models.Model):
+    """Rich lesson body, loaded only for detail views"""
+    lesson = models.OneToOneField(Lesson, on_delete=models.CASCADE, primary_key=True, related_name='body')
+    content = models.TextField()  # Rich content including code examples
+    
+    def __str__(self):
+        return f"Content for {self.lesson_id}"
+    
+    class Meta:
+        db_table = 'lesson_content'
+
+class QuizQuestions(models.Model):
+    """Full question set for a quiz, loaded only when the quiz is taken"""
+    quiz = models.OneToOneField(Quiz, on_delete=models.CASCADE, primary_key=True, related_name='body')
+    questions = models.JSONField()  # Dynamic questions structure
+    
+    def __str__(self):
+        return f"Questions for {self.quiz_id}"
+    
+    class Meta:
+        db_table = 'quiz_questions'
+
 class LearningProgress(models.Model):
     """Track user learning progress and performance"""
     STATUS_CHOICES = [
@@ -148,7 +263,7 @@ class LearningProgress(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='progress')
     lesson = models.ForeignKey(Lesson, on_delete=models.CASCADE, related_name='progress')
-    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='not_started')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='not_started', db_index=True)
     progress_percentage = models.FloatField(
         default=0.0,
         validators=[MinValueValidator(0.0), MaxValueValidator(100.0)]
@@ -164,10 +279,98 @@ class LearningProgress(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = models.Manager()
+    with_related = LearningProgressManager()
+    
     class Meta:
         db_table = 'learning_progress'
         unique_together = ['user', 'lesson']
         ordering = ['-updated_at']
+        indexes = [
+            models.Index(fields=['-updated_at'], name='progress_updated_idx'),
+            models.Index(fields=['user', '-updated_at'], name='progress_user_updated_idx'),
+        ]
+
+class LessonDailyRollup(models.Model):
+    """Per-lesson, per-day enrollment and completion counters for analytics"""
+    lesson = models.ForeignKey(Lesson, on_delete=models.CASCADE, related_name='daily_rollups')
+    day = models.DateField()
+    enrollments = models.IntegerField(default=0)
+    completions = models.IntegerField(default=0)
+    score_total = models.FloatField(default=0.0)
+    score_count = models.IntegerField(default=0)
+    time_spent_total = models.IntegerField(default=0, help_text='Minutes spent by completing learners')
+    
+    def __str__(self):
+        return f"{self.lesson_id} @ {self.day}"
+    
+    @staticmethod
+    def aggregate_progress(progress, days=None):
+        """Counters per (lesson_id, day) computed from a LearningProgress queryset
+
+        Enrollments fall on the day a row was created and completions on its
+        completed_at day, the same for the signals and the rebuild command.
+        ``days`` limits both to those dates.
+        """
+        enrollments = progress
+        completions = progress.filter(status='completed', completed_at__isnull=False)
+        if days is not None:
+            enrollments = enrollments.filter(created_at__date__in=days)
+            completions = completions.filter(completed_at__date__in=days)
+        
+        rows = {}
+        for row in (
+            enrollments.annotate(day=TruncDate('created_at'))
+            .values('lesson_id', 'day')
+            .annotate(enrollments=Count('id'))
+        ):
+            rollup = rows.setdefault((row['lesson_id'], row['day']), {})
+            rollup['enrollments'] = row['enrollments']
+        for row in (
+            completions.annotate(day=TruncDate('completed_at'))
+            .values('lesson_id', 'day')
+            .annotate(
+                completions=Count('id'),
+                time_spent_total=Sum('time_spent'),
+                score_total=Sum('quiz_score'),
+                score_count=Count('quiz_score'),
+            )
+        ):
+            rollup = rows.setdefault((row['lesson_id'], row['day']), {})
+            rollup['completions'] = row['completions']
+            rollup['time_spent_total'] = row['time_spent_total'] or 0
+            rollup['score_total'] = row['score_total'] or 0.0
+            rollup['score_count'] = row['score_count']
+        return rows
+    
+    @classmethod
+    def refresh(cls, lesson_id, days):
+        """Recompute a lesson's rows for ``days`` from its progress rows
+        
+        Recounting instead of incrementing keeps the counters right however
+        often a row is saved, moved between statuses or deleted.
+        """
+        days = sorted(day for day in days if day is not None)
+        if not days:
+            return
+        counters = cls.aggregate_progress(LearningProgress.objects.filter(lesson_id=lesson_id), days)
+        with transaction.atomic():
+            for day in days:
+                values = counters.get((lesson_id, day))
+                if values:
+                    defaults = dict(
+                        enrollments=0, completions=0, score_total=0.0, score_count=0,
+                        time_spent_total=0,
+                    )
+                    defaults.update(values)
+                    cls.objects.update_or_create(lesson_id=lesson_id, day=day, defaults=defaults)
+                else:
+                    cls.objects.filter(lesson_id=lesson_id, day=day).delete()
+    
+    class Meta:
+        db_table = 'lesson_daily_rollup'
+        unique_together = ['lesson', 'day']
+        ordering = ['-day']
 
 class UserMastery(models.Model):
     """Track user's mastery levels across concepts"""
@@ -183,14 +386,21 @@ class UserMastery(models.Model):
         validators=[MinValueValidator(0.0), MaxValueValidator(1.0)]
     )
     last_assessment = models.DateTimeField(default=timezone.now)
-    assessment_history = models.JSONField(default=list)  # History of assessments
+    assessment_history = MsgpackField(default=list)  # History of assessments
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = models.Manager()
+    with_related = UserMasteryManager()
+    
     class Meta:
         db_table = 'user_mastery'
         unique_together = ['user', 'concept']
         ordering = ['-updated_at']
+        indexes = [
+            models.Index(fields=['-updated_at'], name='mastery_updated_idx'),
+            models.Index(fields=['user', '-updated_at'], name='mastery_user_updated_idx'),
+        ]
 
 class LearningSession(models.Model):
     """Track individual learning sessions"""
@@ -201,20 +411,25 @@ class LearningSession(models.Model):
         ('review', 'Review Session'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # Sequential PK keeps inserts on the hot end of the index; public_id is the external ID
+    id = models.BigAutoField(primary_key=True)
+    public_id = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='sessions')
-    session_type = models.CharField(max_length=20, choices=SESSION_TYPES)
+    session_type = models.CharField(max_length=20, choices=SESSION_TYPES, db_index=True)
     content_id = models.UUIDField()  # ID of lesson or quiz
     content_title = models.CharField(max_length=200)
     start_time = models.DateTimeField(auto_now_add=True)
     end_time = models.DateTimeField(null=True, blank=True)
     duration_minutes = models.IntegerField(default=0)
-    interactions = models.JSONField(default=list)  # Track user interactions
-    performance_data = models.JSONField(default=dict)  # Performance metrics
+    interactions = MsgpackField(default=list)  # Track user interactions
+    performance_data = MsgpackField(default=dict)  # Performance metrics
     
     class Meta:
         db_table = 'learning_session'
         ordering = ['-start_time']
+        indexes = [
+            models.Index(fields=['user', '-start_time'], name='session_user_start_idx'),
+        ]
 
 class Achievement(models.Model):
     """Achievement definitions for the platform"""
@@ -272,10 +487,17 @@ class UserAchievement(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = models.Manager()
+    with_related = UserAchievementManager()
+    
     class Meta:
         db_table = 'user_achievement'
         unique_together = ['user', 'achievement']
         ordering = ['-updated_at']
+        indexes = [
+            models.Index(fields=['-updated_at'], name='user_ach_updated_idx'),
+            models.Index(fields=['user', '-updated_at'], name='user_ach_user_updated_idx'),
+        ]
 
 class Badge(models.Model):
     """Badge definitions"""
@@ -302,10 +524,16 @@ class UserBadge(models.Model):
     earned_at = models.DateTimeField(auto_now_add=True)
     metadata = models.JSONField(default=dict)
     
+    objects = models.Manager()
+    with_related = UserBadgeManager()
+    
     class Meta:
         db_table = 'user_badge'
         unique_together = ['user', 'badge']
         ordering = ['-earned_at']
+        indexes = [
+            models.Index(fields=['user', '-earned_at'], name='user_badge_user_earned_idx'),
+        ]
 
 class SystemLog(models.Model):
     """System activity and error logs"""
@@ -327,17 +555,22 @@ class SystemLog(models.Model):
         ('critical', 'Critical'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # Sequential PK keeps inserts on the hot end of the index; public_id is the external ID
+    id = models.BigAutoField(primary_key=True)
+    public_id = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
     log_type = models.CharField(max_length=30, choices=LOG_TYPES)
     message = models.TextField()
     user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True)
     severity = models.CharField(max_length=20, choices=SEVERITY_LEVELS, default='low')
-    metadata = models.JSONField(default=dict)
+    metadata = MsgpackField(default=dict)
     timestamp = models.DateTimeField(auto_now_add=True)
     
     class Meta:
         db_table = 'system_log'
         ordering = ['-timestamp']
+        indexes = [
+            models.Index(fields=['-timestamp', 'log_type'], name='system_log_ts_type_idx'),
+        ]
 
 class AIAgent(models.Model):
     """AI Agent definitions and status"""
@@ -361,7 +594,7 @@ class AIAgent(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     name = models.CharField(max_length=100)
     agent_type = models.CharField(max_length=30, choices=AGENT_TYPES)
-    status = models.CharField(max_length=20, choices=STATUS_TYPES, default='offline')
+    status = models.CharField(max_length=20, choices=STATUS_TYPES, default='offline', db_index=True)
     description = models.TextField()
     tasks = models.IntegerField(default=0)
     uptime = models.IntegerField(default=0, help_text='Uptime in seconds')
@@ -371,17 +604,46 @@ class AIAgent(models.Model):
     health_score = models.FloatField(default=0.0, help_text='Health score 0-100')
     queue_size = models.IntegerField(default=0)
     capabilities = models.JSONField(default=list)
-    config = models.JSONField(default=dict)
+    config = MsgpackField(default=dict)
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    # Columns exposed in the system health agent snapshot
+    SNAPSHOT_FIELDS = ('id', 'status', 'last_active', 'queue_size', 'uptime', 'health_score')
+    ACTIVE_SNAPSHOT_CACHE_KEY = 'system_health:active_agents'
     
     def __str__(self):
         return self.name
     
+    @classmethod
+    def get_active_snapshot(cls):
+        """Formatted status of every active agent, keyed by agent ID (cached)
+        
+        Rows are formatted when the snapshot is built, so each cached copy is
+        converted once rather than on every health request.
+        """
+        snapshot = cache.get(cls.ACTIVE_SNAPSHOT_CACHE_KEY)
+        if snapshot is None:
+            snapshot = {
+                str(agent['id']): {
+                    'status': agent['status'],
+                    'last_active': agent['last_active'].isoformat() if agent['last_active'] else None,
+                    'queue_size': agent['queue_size'],
+                    'uptime_hours': agent['uptime'] // 3600 if agent['uptime'] else 0,
+                    'health_score': agent['health_score']
+                }
+                for agent in cls.objects.filter(is_active=True).values(*cls.SNAPSHOT_FIELDS)
+            }
+            cache.set(cls.ACTIVE_SNAPSHOT_CACHE_KEY, snapshot, ACTIVE_AGENTS_CACHE_TIMEOUT)
+        return snapshot
+    
     class Meta:
         db_table = 'ai_agent'
         ordering = ['name']
+        indexes = [
+            models.Index(fields=['-updated_at'], name='ai_agent_updated_idx'),
+        ]
 
 class SystemHealth(models.Model):
     """System health metrics"""
@@ -403,4 +665,7 @@ class SystemHealth(models.Model):
     
     class Meta:
         db_table = 'system_health'
-        ordering = ['-timestamp']
\ No newline at end of file
+        ordering = ['-timestamp']
+        indexes = [
+            models.Index(fields=['-timestamp'], name='system_health_ts_idx'),
+        ]
\ No newline at end of file
@@ -0,0 +1,115 @@
+"""
+Host resource sampling for the admin dashboards.
+
+Readings are cached briefly so that frequent dashboard polls share one set
+of readings instead of each request making its own syscalls. On Linux CPU
+and memory come straight from /proc; elsewhere psutil provides them. The system
+health snapshot is refreshed by a Celery beat task when workers run, and
+computed on the first request after it expires otherwise.
+"""
+import sys
+
+import psutil
+from django.core.cache import cache
+
+from .models import SystemHealth
+
+SYSTEM_RESOURCES_CACHE_KEY = 'system:resources'
+SYSTEM_RESOURCES_CACHE_TIMEOUT = 5  # seconds
+SYSTEM_HEALTH_CACHE_KEY = 'system:health'
+SYSTEM_HEALTH_CACHE_TIMEOUT = 30  # seconds; the beat task refreshes it every 10
+
+
+IS_LINUX = sys.platform.startswith('linux')
+
+# (busy, total) jiffies from the previous /proc/stat read in this process
+_last_cpu_times = (0, 0)
+
+
+def _read_proc_cpu_percent():
+    """Utilisation since the previous call, from the aggregate /proc/stat line"""
+    global _last_cpu_times
+    with open('/proc/stat', 'rb') as f:
+        # user nice system idle iowait irq softirq steal (guest is already in user)
+        times = [int(value) for value in f.readline().split()[1:9]]
+    total = sum(times)
+    busy = total - times[3] - times[4]
+    last_busy, last_total = _last_cpu_times
+    _last_cpu_times = (busy, total)
+    if total <= last_total:
+        return 0.0
+    return round(100.0 * (busy - last_busy) / (total - last_total), 1)
+
+
+def _read_proc_memory_percent():
+    """Same formula as psutil.virtual_memory().percent, from one /proc/meminfo read"""
+    meminfo = {}
+    with open('/proc/meminfo', 'rb') as f:
+        for line in f:
+            key, value = line.split(b':', 1)
+            if key in (b'MemTotal', b'MemAvailable'):
+                meminfo[key] = int(value.split()[0])
+                if len(meminfo) == 2:
+                    break
+    total = meminfo[b'MemTotal']
+    return round(100.0 * (total - meminfo[b'MemAvailable']) / total, 1)
+
+
+def _read_system_resources():
+    if IS_LINUX:
+        # Two small file reads instead of psutil's fuller /proc parsing
+        cpu = _read_proc_cpu_percent()
+        memory = _read_proc_memory_percent()
+    else:
+        # Utilisation since the previous call in this process (non-blocking)
+        cpu = psutil.cpu_percent()
+        memory = psutil.virtual_memory().percent
+    return {
+        'cpu': cpu,
+        'memory': memory,
+        'disk': psutil.disk_usage('/').percent,
+    }
+
+
+def sample_system_resources():
+    """CPU, memory and disk usage percentages, at most a few seconds old"""
+    return cache.get_or_set(
+        SYSTEM_RESOURCES_CACHE_KEY, _read_system_resources, SYSTEM_RESOURCES_CACHE_TIMEOUT
+    )
+
+
+def refresh_system_health():
+    """Compute the system health snapshot and cache it"""
+    resources = sample_system_resources()
+    cpu_usage = resources['cpu']
+    memory_usage = resources['memory']
+    disk_usage = resources['disk']
+    
+    # Calculate overall status
+    if cpu_usage < 70 and memory_usage < 80:
+        overall_status = 'healthy'
+    elif cpu_usage < 90 and memory_usage < 95:
+        overall_status = 'degraded'
+    else:
+        overall_status = 'unhealthy'
+    
+    # Unsaved: the snapshot lives in the cache, not in the system_health table
+    health = SystemHealth(
+        overall_status=overall_status,
+        health_score=max(0, 100 - (cpu_usage + memory_usage + disk_usage) / 3),
+        active_sessions=0,
+        cpu_usage=cpu_usage,
+        memory_usage=memory_usage,
+        disk_usage=disk_usage,
+        network_latency=50.0,  # Simplified
+    )
+    cache.set(SYSTEM_HEALTH_CACHE_KEY, health, SYSTEM_HEALTH_CACHE_TIMEOUT)
+    return health
+
+
+def get_system_health():
+    """The cached system health snapshot, computed now if it has expired"""
+    health = cache.get(SYSTEM_HEALTH_CACHE_KEY)
+    if health is None:
+        health = refresh_system_health()
+    return health
@@ -0,0 +1,43 @@
+"""
+Push notifications to connected WebSocket clients.
+
+Producers publish straight onto the channel layer group the user's
+NotificationConsumer listens on, so nothing has to poll the database for
+new events. The JSON frame is serialized once here and forwarded as-is.
+"""
+import logging
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.db import transaction
+from django.utils import timezone
+
+from .consumers import _NOTIFICATION_FRAME, json_dumps, notification_group_name
+
+logger = logging.getLogger(__name__)
+
+
+def publish_notification(user_id, notification):
+    """Send a notification to every socket the user has open"""
+    channel_layer = get_channel_layer()
+    if channel_layer is None:
+        return
+    event = {
+        'type': 'send_notification',
+        'notification': notification,
+        'frame': _NOTIFICATION_FRAME.format(json_dumps(notification)),
+    }
+    try:
+        async_to_sync(channel_layer.group_send)(notification_group_name(user_id), event)
+    except Exception as e:
+        # Notifications are best-effort; never fail the caller's write
+        logger.warning(f"Failed to publish notification for user {user_id}: {str(e)}")
+
+
+def publish_on_commit(user_id, notification_type, data):
+    """Publish once the surrounding transaction commits"""
+    notification = {
+        'type': notification_type,
+        'data': data,
+        'timestamp': timezone.now().isoformat(),
+    }
+    transaction.on_commit(lambda: publish_notification(user_id, notification))
@@ -0,0 +1,11 @@
+"""
+Pagination classes for the API application
+"""
+from rest_framework.pagination import PageNumberPagination
+
+
+class AdminPagination(PageNumberPagination):
+    """Page-number pagination for admin management listings"""
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
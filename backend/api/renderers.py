@@ -0,0 +1,48 @@
+"""
+Response renderers for the API application
+"""
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class ORJSONRenderer(JSONRenderer):
+    """JSONRenderer that encodes with orjson when it is installed
+
+    Types orjson does not know natively (Decimal, lazy translation strings,
+    querysets, ...) and datetimes go through DRF's own encoder hook, so the
+    output matches the stock renderer. Indented output falls back to it.
+    """
+    _default = JSONEncoder().default
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if not ORJSON_AVAILABLE:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b''
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        return orjson.dumps(
+            data,
+            default=self._default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+
+
+async def stream_json_array(rows):
+    """Encode an async iterable of rows as a JSON array, one element at a time
+
+    Meant for StreamingHttpResponse under ASGI: only the current row is held
+    in memory, and the first bytes go out before the last row is read.
+    """
+    renderer = ORJSONRenderer()
+    separator = b'['
+    async for row in rows:
+        yield separator + renderer.render(row)
+        separator = b','
+    yield b']' if separator == b',' else b'[]'
@@ -1,13 +1,54 @@
 """
 Comprehensive API Serializers for Jeseci Interactive Learning Platform
 """
+import copy
+from functools import cached_property
 from rest_framework import serializers
 from django.contrib.auth.models import User
 from django.contrib.auth.password_validation import validate_password
+from django.db.models import Case, Count, F, FloatField, Max, OuterRef, Q, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce, Round
 from django.utils import timezone
 from datetime import timedelta
 from .models import UserProfile, Lesson, Quiz, Concept, LearningProgress, LearningSession, UserMastery, Achievement, UserAchievement, Badge, UserBadge, SystemLog, AIAgent, SystemHealth
 
+class CachedFieldsSerializerMixin:
+    """Build a serializer's fields once per class instead of per instance
+    
+    get_fields() re-runs model introspection (and deep-copies every declared
+    field) each time a serializer is created, yet the result only depends on
+    the class. The unbound fields are cached on the class and each instance
+    gets shallow copies to bind; binding only assigns attributes. Fields
+    with a bound child (ListField, DictField, nested many=True) are still
+    deep-copied so the child's parent chain leads to this instance.
+    """
+    
+    def get_fields(self):
+        cls = type(self)
+        cached = cls.__dict__.get('_cached_fields')
+        if cached is None:
+            cached = super().get_fields()
+            cls._cached_fields = cached
+        return {
+            name: copy.deepcopy(field) if hasattr(field, 'child') else copy.copy(field)
+            for name, field in cached.items()
+        }
+
+
+# Choice sets for the admin dashboard serializers, shared by every instance
+ACTIVITY_TYPES = (
+    'user_registration', 'path_completion', 'module_completion',
+    'agent_action', 'system_alert', 'login', 'logout', 'quiz_completion',
+)
+SEVERITY_LEVELS = ('low', 'medium', 'high', 'critical')
+HEALTH_STATUSES = ('healthy', 'degraded', 'unhealthy', 'offline')
+USER_ROLES = ('student', 'instructor', 'admin', 'moderator')
+USER_STATUSES = ('active', 'inactive', 'suspended')
+CONTENT_TYPES = ('learning_path', 'module', 'lesson', 'assessment')
+CONTENT_STATUSES = ('draft', 'published', 'archived')
+DIFFICULTY_LEVELS = ('beginner', 'intermediate', 'advanced')
+
+
 class UserProfileSerializer(serializers.ModelSerializer):
     """Serializer for UserProfile model"""
     username = serializers.CharField(source='user.username', read_only=True)
@@ -17,6 +58,11 @@ class UserProfileSerializer(serializers.ModelSerializer):
         model = UserProfile
         fields = ['id', 'username', 'email', 'learning_style', 'preferred_difficulty', 'avatar_url']
         read_only_fields = ['id']
+    
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Join the user read by the username/email fields"""
+        return queryset.select_related('user')
 
 
 class LoginSerializer(serializers.Serializer):
@@ -26,20 +72,13 @@ class LoginSerializer(serializers.Serializer):
     password = serializers.CharField(write_only=True)
     
     def validate(self, attrs):
-        username = attrs.get('username')
-        email = attrs.get('email')
-        password = attrs.get('password')
-        
-        if not (username or email):
+        # Password presence is enforced by the field itself (required, non-blank)
+        login_field = attrs.get('username') or attrs.get('email')
+        if not login_field:
             raise serializers.ValidationError("Either username or email is required")
         
-        if not password:
-            raise serializers.ValidationError("Password is required")
-        
         # Store the login field for authentication
-        login_field = username or email
         attrs['login_field'] = login_field
-        
         return attrs
 
 
@@ -77,48 +116,69 @@ class UserProfileWithTokensSerializer(serializers.ModelSerializer):
         model = UserProfile
         fields = ['id', 'username', 'email', 'first_name', 'last_name', 'learning_style', 'preferred_difficulty', 'avatar_url']
         read_only_fields = ['id', 'username', 'email', 'first_name', 'last_name']
+    
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Join the user read by the name and email fields"""
+        return queryset.select_related('user')
 
 
 # Simplified serializers for other models (not fully implemented)
-class LessonSerializer(serializers.ModelSerializer):
+# Explicit column lists keep list payloads narrow; M2M fields are left out
+# because each one costs an extra query per row. Views can pass
+# Meta.fields to .only() to match the SELECT to the output.
+LESSON_FIELDS = (
+    'id', 'title', 'description', 'difficulty_level', 'estimated_duration',
+    'is_published', 'created_at', 'updated_at',
+)
+QUIZ_FIELDS = (
+    'id', 'title', 'description', 'difficulty_level', 'time_limit',
+    'is_adaptive', 'created_at', 'updated_at',
+)
+CONCEPT_FIELDS = (
+    'id', 'name', 'description', 'category', 'difficulty_level',
+    'mastery_score', 'last_practiced',
+)
+LEARNING_PROGRESS_FIELDS = (
+    'id', 'user', 'lesson', 'status', 'progress_percentage', 'time_spent',
+    'completed_at', 'quiz_score', 'updated_at',
+)
+
+
+class LessonSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     """Simplified lesson serializer"""
     class Meta:
         model = Lesson
-        fields = '__all__'
+        fields = LESSON_FIELDS
 
 
-class QuizSerializer(serializers.ModelSerializer):
+class QuizSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     """Simplified quiz serializer"""
     class Meta:
         model = Quiz
-        fields = '__all__'
+        fields = QUIZ_FIELDS
 
 
-class ConceptSerializer(serializers.ModelSerializer):
+class ConceptSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     """Simplified concept serializer"""
     class Meta:
         model = Concept
-        fields = '__all__'
+        fields = CONCEPT_FIELDS
 
 
-class LearningProgressSerializer(serializers.ModelSerializer):
+class LearningProgressSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     """Simplified progress serializer"""
     class Meta:
         model = LearningProgress
-        fields = '__all__'
+        fields = LEARNING_PROGRESS_FIELDS
 
 
 # Password Reset Serializers
 class PasswordResetRequestSerializer(serializers.Serializer):
     """Serializer for password reset request"""
+    # Format validation only; the account lookup happens in the background
+    # task so the response never depends on whether the email exists
     email = serializers.EmailField(required=True)
-    
-    def validate_email(self, value):
-        # Check if user exists with this email
-        if not User.objects.filter(email=value).exists():
-            # Don't reveal whether email exists or not for security
-            return value
-        return value
 
 
 class PasswordResetConfirmSerializer(serializers.Serializer):
@@ -158,19 +218,34 @@ class AdminStatsSerializer(serializers.Serializer):
 class RecentActivitySerializer(serializers.Serializer):
     """Serializer for recent activity logs"""
     id = serializers.CharField()
-    type = serializers.ChoiceField(choices=[
-        'user_registration', 'path_completion', 'module_completion', 
-        'agent_action', 'system_alert', 'login', 'logout', 'quiz_completion'
-    ])
+    type = serializers.ChoiceField(choices=ACTIVITY_TYPES)
     message = serializers.CharField()
     timestamp = serializers.DateTimeField()
     user = serializers.CharField(allow_null=True, required=False)
-    severity = serializers.ChoiceField(choices=['low', 'medium', 'high', 'critical'], required=False)
+    severity = serializers.ChoiceField(choices=SEVERITY_LEVELS, required=False)
     metadata = serializers.DictField(required=False)
 
 
-class AgentSerializer(serializers.ModelSerializer):
+class AgentListSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
+    """Compact AI agent serializer for list endpoints
+    
+    Leaves out the description and JSON columns. AdminAgentsView selects
+    Meta.fields with values() and formats the rows itself, so keep the two
+    in step.
+    """
+    class Meta:
+        model = AIAgent
+        fields = [
+            'id', 'name', 'agent_type', 'status', 'tasks', 'uptime', 'performance',
+            'response_time', 'last_active', 'health_score', 'queue_size'
+        ]
+
+
+class AgentDetailSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     """Serializer for AI agents"""
+    # MsgpackField has no default DRF mapping; expose the decoded value as JSON
+    config = serializers.JSONField(required=False)
+    
     class Meta:
         model = AIAgent
         fields = [
@@ -180,9 +255,9 @@ class AgentSerializer(serializers.ModelSerializer):
         ]
 
 
-class SystemHealthSerializer(serializers.Serializer):
+class SystemHealthSerializer(CachedFieldsSerializerMixin, serializers.Serializer):
     """Serializer for system health metrics"""
-    overall_status = serializers.ChoiceField(choices=['healthy', 'degraded', 'unhealthy', 'offline'])
+    overall_status = serializers.ChoiceField(choices=HEALTH_STATUSES)
     health_score = serializers.FloatField()
     active_sessions = serializers.IntegerField()
     system_metrics = serializers.SerializerMethodField()
@@ -198,17 +273,31 @@ class SystemHealthSerializer(serializers.Serializer):
     
     def get_agents(self, obj):
         # Return current agent statuses
-        agents = AIAgent.objects.filter(is_active=True)
-        return {
-            agent.id: {
-                'status': agent.status,
-                'last_active': agent.last_active.isoformat() if agent.last_active else None,
-                'queue_size': agent.queue_size,
-                'uptime_hours': agent.uptime // 3600 if agent.uptime else 0,
-                'health_score': agent.health_score
-            }
-            for agent in agents
-        }
+        return self._agents_snapshot
+    
+    @cached_property
+    def _agents_snapshot(self):
+        """Agent statuses from the view's context, else the cached snapshot"""
+        agents = self.context.get('active_agents')
+        if agents is not None:
+            return agents
+        return AIAgent.get_active_snapshot()
+
+
+# Per-user statistics annotated by UserManagementSerializer.setup_eager_loading
+USER_STAT_FIELDS = (
+    'last_session_time', 'study_time', 'completed_count', 'completed_paths_count',
+    'total_points', 'level', 'role', 'status',
+)
+
+
+class UserManagementListSerializer(serializers.ListSerializer):
+    """Fills in user statistics for a whole page with one query"""
+    
+    def to_representation(self, data):
+        users = list(data.all() if hasattr(data, 'all') else data)
+        self.child.attach_statistics(users)
+        return super().to_representation(users)
 
 
 class UserManagementSerializer(serializers.Serializer):
@@ -218,47 +307,111 @@ class UserManagementSerializer(serializers.Serializer):
     email = serializers.EmailField()
     firstName = serializers.CharField(source='first_name')
     lastName = serializers.CharField(source='last_name')
-    role = serializers.ChoiceField(choices=['student', 'instructor', 'admin', 'moderator'])
-    status = serializers.ChoiceField(choices=['active', 'inactive', 'suspended'])
+    role = serializers.ChoiceField(choices=USER_ROLES)
+    status = serializers.ChoiceField(choices=USER_STATUSES)
     lastActive = serializers.SerializerMethodField()
-    totalPoints = serializers.IntegerField()
+    totalPoints = serializers.IntegerField(source='total_points')
     level = serializers.IntegerField()
     completedPaths = serializers.SerializerMethodField()
-    studyTime = serializers.IntegerField()
+    studyTime = serializers.IntegerField(source='study_time')
     joinDate = serializers.DateTimeField(source='date_joined')
     
+    class Meta:
+        list_serializer_class = UserManagementListSerializer
+    
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Annotate per-user statistics so serializing a page runs no extra queries"""
+        user_sessions = LearningSession.objects.filter(user=OuterRef('pk')).values('user')
+        completed = Q(progress__status='completed')
+        return queryset.select_related('profile').annotate(
+            last_session_time=Subquery(user_sessions.annotate(latest=Max('start_time')).values('latest')),
+            study_time=Coalesce(
+                Subquery(user_sessions.annotate(total=Sum('duration_minutes')).values('total')), 0
+            ),
+            completed_count=Count('progress', filter=completed),
+            completed_paths_count=Count(
+                'progress', filter=completed & Q(progress__progress_percentage=100.0)
+            ),
+        ).annotate(
+            # 10 points per completion, one level per 5 completed lessons
+            total_points=F('completed_count') * 10,
+            level=F('completed_count') / 5 + 1,
+            role=Case(When(is_staff=True, then=Value('admin')), default=Value('student')),
+            status=Case(When(is_active=True, then=Value('active')), default=Value('inactive')),
+        )
+    
+    @classmethod
+    def attach_statistics(cls, users):
+        """Copy the annotated statistics onto users that lack them (one query)"""
+        missing = [user for user in users if not hasattr(user, 'completed_paths_count')]
+        if not missing:
+            return
+        stats = cls.setup_eager_loading(
+            User.objects.filter(pk__in=[user.pk for user in missing])
+        ).values('pk', *USER_STAT_FIELDS)
+        stats_by_pk = {row.pop('pk'): row for row in stats}
+        for user in missing:
+            for name, value in stats_by_pk[user.pk].items():
+                setattr(user, name, value)
+    
+    def to_representation(self, instance):
+        # A single user gets the same indexed aggregate query as a page
+        self.attach_statistics([instance])
+        return super().to_representation(instance)
+    
     def get_lastActive(self, obj):
-        # Get last activity from UserProfile or LearningSession
-        profile = getattr(obj, 'profile', None)
-        if profile and profile.updated_at:
-            return profile.updated_at.isoformat()
-        
-        last_session = LearningSession.objects.filter(user=obj).order_by('-start_time').first()
-        return last_session.start_time.isoformat() if last_session else obj.date_joined.isoformat()
+        # Latest learning session, then profile activity, then sign-up
+        last_active = getattr(obj, 'last_session_time', None)
+        if last_active is None:
+            profile = getattr(obj, 'profile', None)
+            last_active = profile.updated_at if profile else obj.date_joined
+        return last_active.isoformat()
     
     def get_completedPaths(self, obj):
         # Count completed learning paths (simplified)
-        return LearningProgress.objects.filter(
-            user=obj, 
-            status='completed',
-            progress_percentage=100.0
-        ).count()
+        return obj.completed_paths_count
 
 
 class ContentManagementSerializer(serializers.Serializer):
-    """Serializer for content management"""
+    """Serializer for content management
+    
+    Reads annotated Lesson rows; pass querysets through setup_eager_loading()
+    so the author and learner counts come from the same query.
+    """
     id = serializers.CharField()
     title = serializers.CharField()
-    type = serializers.ChoiceField(choices=['learning_path', 'module', 'lesson', 'assessment'])
-    status = serializers.ChoiceField(choices=['draft', 'published', 'archived'])
+    type = serializers.ChoiceField(choices=CONTENT_TYPES, source='content_type')
+    status = serializers.ChoiceField(choices=CONTENT_STATUSES, source='publish_status')
     modules = serializers.IntegerField()
-    completionRate = serializers.FloatField()
+    completionRate = serializers.FloatField(source='completion_rate')
     learners = serializers.IntegerField()
-    avgScore = serializers.FloatField()
+    avgScore = serializers.FloatField(source='avg_score')
     lastUpdated = serializers.DateTimeField(source='updated_at')
-    createdBy = serializers.CharField(source='created_by.username')
-    difficulty = serializers.ChoiceField(choices=['beginner', 'intermediate', 'advanced'])
-    tags = serializers.ListField(child=serializers.CharField())
+    createdBy = serializers.CharField(source='created_by.username', default='System')
+    difficulty = serializers.ChoiceField(choices=DIFFICULTY_LEVELS, source='difficulty_level')
+    tags = serializers.SerializerMethodField()
+    
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Join the author and annotate per-lesson learner statistics"""
+        return queryset.select_related('created_by').annotate(
+            learners=Count('progress'),
+            completed_learners=Count('progress', filter=Q(progress__status='completed')),
+        ).annotate(
+            completion_rate=Case(
+                When(learners=0, then=Value(0.0)),
+                default=Round(F('completed_learners') * 100.0 / F('learners'), 2),
+                output_field=FloatField(),
+            ),
+            content_type=Value('lesson'),
+            publish_status=Case(When(is_published=True, then=Value('published')), default=Value('draft')),
+            modules=Value(1),  # Lessons are modules
+            avg_score=Value(85.0),  # Simplified
+        )
+    
+    def get_tags(self, obj):
+        return [obj.difficulty_level]
 
 
 class LearningAnalyticsSerializer(serializers.Serializer):
@@ -275,7 +428,7 @@ class LearningAnalyticsSerializer(serializers.Serializer):
 
 
 # Learning API Serializers
-class AchievementSerializer(serializers.ModelSerializer):
+class AchievementSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     """Serializer for achievements"""
     class Meta:
         model = Achievement
@@ -286,10 +439,19 @@ class AchievementSerializer(serializers.ModelSerializer):
         ]
 
 
-class UserAchievementSerializer(serializers.ModelSerializer):
-    """Serializer for user achievements with progress"""
+class UserAchievementSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
+    """Serializer for user achievements with progress
+    
+    Nests the achievement, so pass querysets through setup_eager_loading()
+    to avoid one achievement query per row.
+    """
     achievement = AchievementSerializer(read_only=True)
     
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Join the nested achievement into the queryset"""
+        return queryset.select_related('achievement')
+    
     class Meta:
         model = UserAchievement
         fields = [
@@ -298,23 +460,32 @@ class UserAchievementSerializer(serializers.ModelSerializer):
         ]
 
 
-class BadgeSerializer(serializers.ModelSerializer):
+class BadgeSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     """Serializer for badges"""
     class Meta:
         model = Badge
         fields = ['id', 'name', 'description', 'icon', 'color', 'requirements', 'is_active']
 
 
-class UserBadgeSerializer(serializers.ModelSerializer):
-    """Serializer for user badges"""
+class UserBadgeSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
+    """Serializer for user badges
+    
+    Nests the badge, so pass querysets through setup_eager_loading() to
+    avoid one badge query per row.
+    """
     badge = BadgeSerializer(read_only=True)
     
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Join the nested badge into the queryset"""
+        return queryset.select_related('badge')
+    
     class Meta:
         model = UserBadge
         fields = ['id', 'badge', 'earned_at', 'metadata']
 
 
-class ModuleContentSerializer(serializers.Serializer):
+class ModuleContentSerializer(CachedFieldsSerializerMixin, serializers.Serializer):
     """Serializer for module content"""
     id = serializers.CharField()
     title = serializers.CharField()
@@ -343,12 +514,8 @@ class AdminUserCreateSerializer(serializers.ModelSerializer):
     
     def create(self, validated_data):
         validated_data.pop('password_confirm', None)
-        user = User.objects.create_user(**validated_data)
-        
-        # Create user profile
-        UserProfile.objects.get_or_create(user=user)
-        
-        return user
+        # The post_save signal creates the user's profile
+        return User.objects.create_user(**validated_data)
 
 
 class AdminUserUpdateSerializer(serializers.ModelSerializer):
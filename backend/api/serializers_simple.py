@@ -5,6 +5,7 @@ from rest_framework import serializers
 from django.contrib.auth.models import User
 from django.contrib.auth.password_validation import validate_password
 from .models import UserProfile, Lesson, Quiz, Concept, LearningProgress
+from .serializers import LESSON_FIELDS, QUIZ_FIELDS, CONCEPT_FIELDS, LEARNING_PROGRESS_FIELDS
 
 class UserProfileSerializer(serializers.ModelSerializer):
     """Serializer for UserProfile model"""
@@ -82,25 +83,25 @@ class LessonSerializer(serializers.ModelSerializer):
     """Simplified lesson serializer"""
     class Meta:
         model = Lesson
-        fields = '__all__'
+        fields = LESSON_FIELDS
 
 
 class QuizSerializer(serializers.ModelSerializer):
     """Simplified quiz serializer"""
     class Meta:
         model = Quiz
-        fields = '__all__'
+        fields = QUIZ_FIELDS
 
 
 class ConceptSerializer(serializers.ModelSerializer):
     """Simplified concept serializer"""
     class Meta:
         model = Concept
-        fields = '__all__'
+        fields = CONCEPT_FIELDS
 
 
 class LearningProgressSerializer(serializers.ModelSerializer):
     """Simplified progress serializer"""
     class Meta:
         model = LearningProgress
-        fields = '__all__'
\ No newline at end of file
+        fields = LEARNING_PROGRESS_FIELDS
\ No newline at end of file
@@ -1,8 +1,15 @@
 """Signal handlers for the API application"""
-from django.db.models.signals import post_save
+from django.db.models.signals import m2m_changed, post_init, pre_save, post_save, post_delete
 from django.dispatch import receiver
 from django.contrib.auth.models import User
-from .models import UserProfile
+from django.core.cache import cache
+from django.utils import timezone
+from .models import (
+    ACHIEVEMENTS_CACHE_KEY, ADMIN_AGENTS_CACHE_KEY, UserProfile, Lesson, Concept,
+    ConceptRelation, Achievement, UserAchievement, UserBadge, AIAgent, LearningProgress,
+    LessonDailyRollup, SystemLog, touch_admin_dashboard
+)
+from .notifications import publish_on_commit
 
 @receiver(post_save, sender=User)
 def create_user_profile(sender, instance, created, **kwargs):
@@ -14,4 +21,172 @@ def create_user_profile(sender, instance, created, **kwargs):
 def save_user_profile(sender, instance, **kwargs):
     """Save UserProfile when User is saved"""
     if hasattr(instance, 'userprofile'):
-        instance.userprofile.save()
\ No newline at end of file
+        instance.userprofile.save()
+
+@receiver([post_save, post_delete], sender=ConceptRelation)
+def invalidate_related_concepts(sender, instance, **kwargs):
+    """Drop the cached adjacency list when a concept relation changes"""
+    cache.delete(Concept.related_cache_key(instance.from_concept_id))
+
+@receiver(post_save, sender=ConceptRelation)
+def mirror_concept_relation(sender, instance, raw=False, **kwargs):
+    """Save the reverse edge too, as related_concepts.add() does"""
+    if raw:
+        return
+    mirror, created = ConceptRelation.objects.get_or_create(
+        from_concept_id=instance.to_concept_id,
+        to_concept_id=instance.from_concept_id,
+        defaults={'weight': instance.weight},
+    )
+    if not created and mirror.weight != instance.weight:
+        mirror.weight = instance.weight
+        mirror.save(update_fields=['weight'])
+
+@receiver(post_delete, sender=ConceptRelation)
+def delete_mirrored_relation(sender, instance, **kwargs):
+    """Delete the reverse edge with the one removed"""
+    ConceptRelation.objects.filter(
+        from_concept_id=instance.to_concept_id,
+        to_concept_id=instance.from_concept_id,
+    ).delete()
+
+@receiver(m2m_changed, sender=Concept.related_concepts.through)
+def invalidate_related_concepts_m2m(sender, instance, action, pk_set, **kwargs):
+    """Drop cached adjacency lists changed through the related_concepts manager
+
+    add(), remove() and clear() write the through table with bulk queries,
+    which send m2m_changed instead of post_save/post_delete. The relation is
+    symmetric, so every concept on either end has changed.
+    """
+    if action == 'pre_clear':
+        # pk_set is None for clear(), so note the partners before they go
+        instance._cleared_related_ids = list(
+            instance.outgoing_relations.values_list('to_concept_id', flat=True)
+        )
+        return
+    if action == 'post_clear':
+        pk_set = instance.__dict__.pop('_cleared_related_ids', [])
+    elif action not in ('post_add', 'post_remove'):
+        return
+    cache.delete_many([
+        Concept.related_cache_key(concept_id) for concept_id in [instance.pk, *pk_set]
+    ])
+
+@receiver([post_save, post_delete], sender=AIAgent)
+def invalidate_active_agents(sender, instance, **kwargs):
+    """Drop the cached agent snapshot and the admin agent list"""
+    cache.delete_many([AIAgent.ACTIVE_SNAPSHOT_CACHE_KEY, ADMIN_AGENTS_CACHE_KEY])
+
+@receiver([post_save, post_delete], sender=Achievement)
+def invalidate_achievements(sender, instance, **kwargs):
+    """Drop the cached achievement catalog"""
+    cache.delete(ACHIEVEMENTS_CACHE_KEY)
+
+@receiver([post_save, post_delete], sender=User)
+@receiver([post_save, post_delete], sender=Lesson)
+@receiver([post_save, post_delete], sender=LearningProgress)
+@receiver(post_save, sender=SystemLog)
+def invalidate_admin_dashboard(sender, instance, **kwargs):
+    """Drop the cached admin statistics and change the dashboard ETag"""
+    touch_admin_dashboard()
+
+@receiver(post_init, sender=UserAchievement)
+def remember_unlock_state(sender, instance, **kwargs):
+    """Record the loaded unlock state so a later save can detect the transition"""
+    # Reading a deferred field would cost a query per loaded row
+    if 'is_unlocked' in instance.get_deferred_fields():
+        return
+    instance._was_unlocked = instance.is_unlocked
+
+@receiver(post_save, sender=UserAchievement)
+def notify_achievement_unlocked(sender, instance, **kwargs):
+    """Push a notification when an achievement becomes unlocked"""
+    if 'is_unlocked' in instance.get_deferred_fields():
+        # Neither loaded nor assigned, so this save cannot unlock it
+        return
+    # Unset when is_unlocked was deferred at load and assigned since
+    was_unlocked = getattr(instance, '_was_unlocked', False)
+    if instance.is_unlocked and not was_unlocked:
+        achievement = instance.achievement
+        publish_on_commit(instance.user_id, 'achievement_unlocked', {
+            'id': str(instance.id),
+            'achievement_id': achievement.id,
+            'name': achievement.name,
+            'icon': achievement.icon,
+            'points': achievement.points,
+        })
+    instance._was_unlocked = instance.is_unlocked
+
+@receiver(post_save, sender=UserBadge)
+def notify_badge_earned(sender, instance, created, **kwargs):
+    """Push a notification when a badge is awarded"""
+    if created:
+        badge = instance.badge
+        publish_on_commit(instance.user_id, 'badge_earned', {
+            'id': str(instance.id),
+            'badge_id': badge.id,
+            'name': badge.name,
+            'icon': badge.icon,
+            'color': badge.color,
+        })
+
+# Fields that decide which rollup day a progress row's completion counts on
+ROLLUP_SLOT_FIELDS = {'lesson_id', 'status', 'completed_at'}
+
+def _rollup_slot(lesson_id, status, completed_at):
+    """(lesson_id, completion day or None) a progress row counts toward"""
+    if status != 'completed' or completed_at is None:
+        return lesson_id, None
+    return lesson_id, timezone.localdate(completed_at)
+
+def _refresh_rollup(slots):
+    """Recount every lesson day named in ``slots``"""
+    days_by_lesson = {}
+    for lesson_id, day in slots:
+        days_by_lesson.setdefault(lesson_id, set()).add(day)
+    for lesson_id, days in days_by_lesson.items():
+        LessonDailyRollup.refresh(lesson_id, days)
+
+@receiver(post_init, sender=LearningProgress)
+def remember_rollup_slot(sender, instance, **kwargs):
+    """Record where the loaded row counts so a later save can recount that day"""
+    # Reading a deferred field would cost a query per loaded row
+    if ROLLUP_SLOT_FIELDS & instance.get_deferred_fields():
+        return
+    instance._rollup_slot = _rollup_slot(instance.lesson_id, instance.status, instance.completed_at)
+
+@receiver(pre_save, sender=LearningProgress)
+def prepare_rollup_update(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Date new completions and look up the old slot post_init had to skip"""
+    if raw:
+        return
+    if not instance._state.adding and not hasattr(instance, '_rollup_slot'):
+        stored = LearningProgress.objects.filter(pk=instance.pk).values_list(
+            'lesson_id', 'status', 'completed_at'
+        ).first()
+        if stored is not None:
+            instance._rollup_slot = _rollup_slot(*stored)
+    # Completions are counted on their completed_at day, so they need one
+    saves_completed_at = update_fields is None or 'completed_at' in update_fields
+    if saves_completed_at and instance.status == 'completed' and instance.completed_at is None:
+        instance.completed_at = timezone.now()
+
+@receiver(post_save, sender=LearningProgress)
+def update_lesson_rollup(sender, instance, created, raw=False, **kwargs):
+    """Keep the daily analytics rollup in step with learner progress"""
+    if raw:
+        return
+    slot = _rollup_slot(instance.lesson_id, instance.status, instance.completed_at)
+    slots = {slot, getattr(instance, '_rollup_slot', slot)}
+    if created:
+        slots.add((instance.lesson_id, timezone.localdate(instance.created_at)))
+    _refresh_rollup(slots)
+    instance._rollup_slot = slot
+
+@receiver(post_delete, sender=LearningProgress)
+def remove_from_lesson_rollup(sender, instance, **kwargs):
+    """Take a deleted row's enrollment and completion out of the rollup"""
+    _refresh_rollup({
+        _rollup_slot(instance.lesson_id, instance.status, instance.completed_at),
+        (instance.lesson_id, timezone.localdate(instance.created_at)),
+    })
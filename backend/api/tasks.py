@@ -0,0 +1,60 @@
+"""
+Background tasks for the API application
+"""
+import logging
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.contrib.auth.tokens import default_token_generator
+from django.core.mail import send_mail
+
+from .monitoring import refresh_system_health
+
+try:
+    from celery import shared_task
+    CELERY_AVAILABLE = True
+except ImportError:
+    CELERY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def send_password_reset_email(email):
+    """Look up the account for ``email`` and mail it a reset token"""
+    user = User.objects.filter(email__iexact=email, is_active=True).only(
+        'id', 'email', 'username', 'password', 'last_login'
+    ).first()
+    if user is None:
+        return
+    token = default_token_generator.make_token(user)
+    send_mail(
+        'Reset your Jeseci password',
+        f"Hi {user.username},\n\nUse this token to reset your password: {token}\n",
+        getattr(settings, 'DEFAULT_FROM_EMAIL', None),
+        [user.email],
+    )
+
+
+if CELERY_AVAILABLE:
+    send_password_reset_email_task = shared_task(ignore_result=True)(send_password_reset_email)
+
+
+def queue_password_reset_email(email):
+    """Dispatch the reset email off the request path when Celery is available"""
+    if CELERY_AVAILABLE:
+        try:
+            send_password_reset_email_task.delay(email)
+            return
+        except Exception as e:
+            logger.warning(f"Could not queue password reset email, sending inline: {str(e)}")
+    try:
+        send_password_reset_email(email)
+    except Exception as e:
+        # Failing only for known addresses would reveal which accounts exist
+        logger.error(f"Password reset email failed: {str(e)}")
+
+
+if CELERY_AVAILABLE:
+    # Scheduled by CELERY_BEAT_SCHEDULE in settings
+    refresh_system_health_task = shared_task(
+        name='api.tasks.refresh_system_health', ignore_result=True
+    )(refresh_system_health)
@@ -17,19 +17,22 @@ urlpatterns = [
     path('auth/password-reset-confirm/', views.PasswordResetConfirmView.as_view(), name='auth_password_reset_confirm'),
     
     # Admin API Endpoints
+    path('admin/dashboard/', views.AdminDashboardView.as_view(), name='admin_dashboard'),
     path('admin/stats/', views.AdminStatsView.as_view(), name='admin_stats'),
     path('admin/activity/', views.AdminActivityView.as_view(), name='admin_activity'),
     path('admin/users/', views.AdminUsersView.as_view(), name='admin_users'),
-    path('admin/users/<uuid:user_id>/', views.AdminUserDetailView.as_view(), name='admin_user_detail'),
+    path('admin/users/<int:user_id>/', views.AdminUserDetailView.as_view(), name='admin_user_detail'),
     path('admin/content/', views.AdminContentView.as_view(), name='admin_content'),
     path('admin/analytics/', views.AdminAnalyticsView.as_view(), name='admin_analytics'),
     path('admin/agents/', views.AdminAgentsView.as_view(), name='admin_agents'),
+    path('admin/agents/<uuid:agent_id>/', views.AdminAgentDetailView.as_view(), name='admin_agent_detail'),
     path('admin/system-health/', views.AdminSystemHealthView.as_view(), name='admin_system_health'),
     
     # Learning API Endpoints
     path('api/achievements/', views.AchievementsView.as_view(), name='achievements'),
-    path('api/user/<uuid:user_id>/badges/', views.UserBadgesView.as_view(), name='user_badges'),
+    path('api/user/<int:user_id>/badges/', views.UserBadgesView.as_view(), name='user_badges'),
     path('api/modules/<uuid:module_id>/content/', views.ModuleContentView.as_view(), name='module_content'),
+    path('api/concepts/<uuid:concept_id>/', views.ConceptDetailView.as_view(), name='concept_detail'),
     
     # System Health and Monitoring
     path('health/', views.HealthCheckView.as_view(), name='health_check'),
@@ -2,33 +2,52 @@
 Comprehensive API Views for Jeseci Interactive Learning Platform
 """
 import logging
-import psutil
-from django.http import JsonResponse
+import secrets
+import time
+from django.conf import settings
+from django.http import Http404, JsonResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from django.contrib.auth.models import User
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.hashers import make_password
-from django.db.models import Count, Avg, Q
+from django.contrib.auth.tokens import default_token_generator
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Avg, Q, Sum
+from django.db.models.functions import TruncMonth
 from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import etag
 from datetime import datetime, timedelta
-from rest_framework import status, permissions, viewsets
+from rest_framework import generics, status, permissions, viewsets
 from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated, IsAdminUser
 from rest_framework.response import Response
+from rest_framework.throttling import ScopedRateThrottle
 from rest_framework.views import APIView
 
-from .models import UserProfile, Lesson, Quiz, Concept, LearningProgress, LearningSession, UserMastery, Achievement, UserAchievement, Badge, UserBadge, SystemLog, AIAgent, SystemHealth
+from .models import ACHIEVEMENTS_CACHE_KEY, ACHIEVEMENTS_CACHE_TIMEOUT, ADMIN_AGENTS_CACHE_KEY, ADMIN_AGENTS_CACHE_TIMEOUT, ADMIN_STATS_CACHE_KEY, ADMIN_STATS_CACHE_TIMEOUT, admin_dashboard_version, UserProfile, Lesson, Quiz, Concept, LearningProgress, LessonDailyRollup, LearningSession, UserMastery, Achievement, UserAchievement, Badge, UserBadge, SystemLog, AIAgent, SystemHealth
 from .serializers import (
     LoginSerializer, RegisterSerializer, PasswordResetRequestSerializer, PasswordResetConfirmSerializer,
-    AdminStatsSerializer, RecentActivitySerializer, AgentSerializer, SystemHealthSerializer,
-    UserManagementSerializer, ContentManagementSerializer, LearningAnalyticsSerializer,
+    AgentListSerializer, AgentDetailSerializer, SystemHealthSerializer,
+    UserManagementSerializer, ContentManagementSerializer,
     AchievementSerializer, UserAchievementSerializer, BadgeSerializer, UserBadgeSerializer,
-    ModuleContentSerializer, AdminUserCreateSerializer, AdminUserUpdateSerializer
+    ModuleContentSerializer, AdminUserCreateSerializer, AdminUserUpdateSerializer,
+    ConceptSerializer
 )
+from .audit import log_action
+from .monitoring import get_system_health, sample_system_resources
+from .pagination import AdminPagination
+from .renderers import stream_json_array
+from .tasks import queue_password_reset_email
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per database round-trip when streaming a listing
+STREAM_CHUNK_SIZE = 500
+
 
 class LoginView(APIView):
     """Session-based login view"""
@@ -38,19 +57,13 @@ class LoginView(APIView):
         try:
             serializer = LoginSerializer(data=request.data)
             if serializer.is_valid():
-                username_or_email = serializer.validated_data.get('username') or serializer.validated_data.get('email')
+                username_or_email = serializer.validated_data['login_field']
                 password = serializer.validated_data['password']
                 
                 # Authenticate user
                 user = authenticate(request, username=username_or_email, password=password)
                 
                 if user is not None:
-                    # Check if this is email login
-                    if '@' in username_or_email:
-                        username = user.username
-                    else:
-                        username = username_or_email
-                    
                     # Login the user (creates session)
                     login(request, user)
                     
@@ -94,21 +107,16 @@ class RegisterView(APIView):
         try:
             serializer = RegisterSerializer(data=request.data)
             if serializer.is_valid():
-                # Create user
-                user = User.objects.create_user(
-                    username=serializer.validated_data['username'],
-                    email=serializer.validated_data['email'],
-                    password=serializer.validated_data['password'],
-                    first_name=serializer.validated_data.get('first_name', ''),
-                    last_name=serializer.validated_data.get('last_name', ''),
-                )
-                
-                # Create user profile
-                try:
-                    UserProfile.objects.create(user=user)
-                except Exception as e:
-                    # Profile might already exist or other error
-                    logger.warning(f"Profile creation error: {str(e)}")
+                # Create user; the post_save signal adds its profile in the
+                # same transaction, so neither row exists without the other
+                with transaction.atomic():
+                    user = User.objects.create_user(
+                        username=serializer.validated_data['username'],
+                        email=serializer.validated_data['email'],
+                        password=serializer.validated_data['password'],
+                        first_name=serializer.validated_data.get('first_name', ''),
+                        last_name=serializer.validated_data.get('last_name', ''),
+                    )
                 
                 return Response({
                     'status': 'success',
@@ -229,8 +237,9 @@ class UserProfileView(APIView):
     
     def get(self, request):
         try:
+            # Only User fields are returned; the profile row itself is created
+            # by the post_save signal when the user is
             user = request.user
-            profile, created = UserProfile.objects.get_or_create(user=user)
             return Response({
                 'user': {
                     'id': user.id,
@@ -312,6 +321,8 @@ class SystemStatsView(APIView):
 class PasswordResetRequestView(APIView):
     """Handle password reset requests"""
     permission_classes = [AllowAny]
+    throttle_classes = [ScopedRateThrottle]
+    throttle_scope = 'password_reset'
     
     def post(self, request):
         try:
@@ -319,24 +330,19 @@ class PasswordResetRequestView(APIView):
             if serializer.is_valid():
                 email = serializer.validated_data['email']
                 
-                # Check if user exists (but don't reveal this for security)
-                user = User.objects.filter(email=email).first()
+                # Account lookup and email delivery run off the request path,
+                # so the response is the same whether or not the user exists
+                queue_password_reset_email(email)
                 
-                # For demo purposes, generate a simple token
-                # In production, this would be sent via email
-                import secrets
-                reset_token = secrets.token_urlsafe(32)
-                
-                # For development: Return the token so frontend can test
-                if user:
-                    # In production, save token to database with expiry
-                    pass
-                
-                return Response({
+                response_data = {
                     'status': 'success',
-                    'message': 'Password reset instructions sent to your email' if user else 'If this email exists, instructions have been sent',
-                    'token': reset_token  # For development/testing only
-                }, status=status.HTTP_200_OK)
+                    'message': 'If this email exists, instructions have been sent',
+                }
+                if settings.DEBUG:
+                    # For development/testing only; never depends on the account
+                    response_data['token'] = secrets.token_urlsafe(32)
+                
+                return Response(response_data, status=status.HTTP_200_OK)
             else:
                 return Response({
                     'status': 'error',
@@ -363,17 +369,18 @@ class PasswordResetConfirmView(APIView):
                 token = serializer.validated_data['token']
                 new_password = serializer.validated_data['new_password']
                 
-                # For demo purposes, accept any token
-                # In production, validate token against database and check expiry
-                
-                # For now, prompt for email to find user
-                # In production, token would identify the user
+                # The token mailed by send_password_reset_email does not name
+                # the account, so the email picks the user it must match. The
+                # lookup mirrors that task's, and loads every field the token
+                # hash reads. Migration 0010 indexes it on PostgreSQL only.
                 email = request.data.get('email')
                 if email:
-                    user = User.objects.filter(email=email).first()
-                    if user:
+                    user = User.objects.filter(email__iexact=email, is_active=True).only(
+                        'id', 'email', 'password', 'last_login'
+                    ).first()
+                    if user and default_token_generator.check_token(user, token):
                         user.set_password(new_password)
-                        user.save()
+                        user.save(update_fields=['password'])
                         
                         return Response({
                             'status': 'success',
@@ -411,63 +418,83 @@ class AdminStatsView(APIView):
     
     def get(self, request):
         try:
-            # Calculate statistics
-            total_users = User.objects.count()
-            total_paths = 0  # We'll need a LearningPath model for this
-            total_modules = Lesson.objects.count()
-            total_lessons = Lesson.objects.count()
-            
-            # Active users in last 7 days
-            active_users = User.objects.filter(
-                last_login__gte=timezone.now() - timedelta(days=7)
-            ).count()
-            
-            # Completion rate
-            total_progress = LearningProgress.objects.count()
-            completed_progress = LearningProgress.objects.filter(status='completed').count()
-            completion_rate = (completed_progress / total_progress * 100) if total_progress > 0 else 0
-            
-            # Total sessions
-            total_sessions = LearningSession.objects.count()
-            
-            # Average study time (simplified)
-            avg_study_time = LearningSession.objects.aggregate(
-                avg_duration=Avg('duration_minutes')
-            )['avg_duration'] or 0
-            
-            # System health
-            cpu_usage = psutil.cpu_percent()
-            memory_usage = psutil.virtual_memory().percent
-            
-            # Agents
-            total_agents = AIAgent.objects.count()
-            active_agents = AIAgent.objects.filter(status__in=['active', 'busy']).count()
-            agent_tasks = AIAgent.objects.aggregate(total_tasks=Count('tasks'))['total_tasks'] or 0
-            response_time = AIAgent.objects.aggregate(avg_response=Avg('response_time'))['avg_response'] or 0
-            system_health = max(0, 100 - (cpu_usage + memory_usage) / 2)
-            
-            stats_data = {
-                'totalUsers': total_users,
-                'totalPaths': total_paths,
-                'totalModules': total_modules,
-                'totalLessons': total_lessons,
-                'activeUsers': active_users,
-                'completionRate': round(completion_rate, 2),
-                'totalSessions': total_sessions,
-                'avgStudyTime': round(avg_study_time, 2),
-                'systemHealth': round(system_health, 2),
-                'activeAgents': active_agents,
-                'totalAgents': total_agents,
-                'agentTasks': agent_tasks,
-                'responseTime': round(response_time, 2)
-            }
-            
-            serializer = AdminStatsSerializer(stats_data)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            # Already plain ints/floats; no serializer pass needed
+            return Response(self.get_stats(), status=status.HTTP_200_OK)
             
         except Exception as e:
             logger.error(f"Error getting admin stats: {str(e)}")
             return Response({'error': 'Failed to fetch statistics'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    
+    @classmethod
+    def get_stats(cls):
+        """Dashboard statistics, recomputed at most every ADMIN_STATS_CACHE_TIMEOUT seconds"""
+        return cache.get_or_set(ADMIN_STATS_CACHE_KEY, cls._compute_stats, ADMIN_STATS_CACHE_TIMEOUT)
+    
+    @staticmethod
+    def _compute_stats():
+        """Calculate the dashboard statistics, one aggregate query per model"""
+        # Users, with those active in the last 7 days
+        user_stats = User.objects.aggregate(
+            total=Count('id'),
+            active=Count('id', filter=Q(last_login__gte=timezone.now() - timedelta(days=7))),
+        )
+        total_users = user_stats['total']
+        active_users = user_stats['active']
+        total_paths = 0  # We'll need a LearningPath model for this
+        total_lessons = Lesson.objects.count()
+        total_modules = total_lessons
+        
+        # Completion rate
+        progress_stats = LearningProgress.objects.aggregate(
+            total=Count('id'),
+            completed=Count('id', filter=Q(status='completed')),
+        )
+        total_progress = progress_stats['total']
+        completed_progress = progress_stats['completed']
+        completion_rate = (completed_progress / total_progress * 100) if total_progress > 0 else 0.0
+        
+        # Total sessions and average study time (simplified)
+        session_stats = LearningSession.objects.aggregate(
+            total=Count('id'),
+            avg_duration=Avg('duration_minutes'),
+        )
+        total_sessions = session_stats['total']
+        avg_study_time = session_stats['avg_duration'] or 0.0
+        
+        # System health
+        resources = sample_system_resources()
+        cpu_usage = resources['cpu']
+        memory_usage = resources['memory']
+        
+        # Agents
+        agent_stats = AIAgent.objects.aggregate(
+            total=Count('id'),
+            active=Count('id', filter=Q(status__in=['active', 'busy'])),
+            total_tasks=Sum('tasks'),
+            avg_response=Avg('response_time'),
+        )
+        total_agents = agent_stats['total']
+        active_agents = agent_stats['active']
+        agent_tasks = agent_stats['total_tasks'] or 0
+        response_time = agent_stats['avg_response'] or 0.0
+        system_health = max(0.0, 100 - (cpu_usage + memory_usage) / 2)
+        
+        stats_data = {
+            'totalUsers': total_users,
+            'totalPaths': total_paths,
+            'totalModules': total_modules,
+            'totalLessons': total_lessons,
+            'activeUsers': active_users,
+            'completionRate': round(completion_rate, 2),
+            'totalSessions': total_sessions,
+            'avgStudyTime': round(avg_study_time, 2),
+            'systemHealth': round(system_health, 2),
+            'activeAgents': active_agents,
+            'totalAgents': total_agents,
+            'agentTasks': agent_tasks,
+            'responseTime': round(response_time, 2)
+        }
+        return stats_data
 
 
 class AdminActivityView(APIView):
@@ -476,68 +503,50 @@ class AdminActivityView(APIView):
     
     def get(self, request):
         try:
-            # Get recent logs
-            logs = SystemLog.objects.select_related('user')[:50]
-            
-            activity_data = []
-            for log in logs:
-                activity_data.append({
-                    'id': str(log.id),
-                    'type': log.log_type,
-                    'message': log.message,
-                    'timestamp': log.timestamp.isoformat(),
-                    'user': log.user.username if log.user else None,
-                    'severity': log.severity,
-                    'metadata': log.metadata
-                })
-            
-            serializer = RecentActivitySerializer(activity_data, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            return Response(self.get_activity(), status=status.HTTP_200_OK)
             
         except Exception as e:
             logger.error(f"Error getting admin activity: {str(e)}")
             return Response({'error': 'Failed to fetch activity'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    
+    @staticmethod
+    def get_activity():
+        """The 50 most recent system log entries"""
+        # Newest first as plain rows, read backwards from system_log_ts_type_idx
+        logs = SystemLog.objects.order_by('-timestamp').values(
+            'public_id', 'log_type', 'message', 'timestamp', 'user__username', 'severity', 'metadata'
+        )[:50]
+        
+        activity_data = [
+            {
+                'id': str(log['public_id']),
+                'type': log['log_type'],
+                'message': log['message'],
+                'timestamp': log['timestamp'].isoformat(),
+                'user': log['user__username'],
+                'severity': log['severity'],
+                'metadata': log['metadata']
+            }
+            for log in logs
+        ]
+        return activity_data
 
 
-class AdminUsersView(APIView):
+class AdminUsersView(generics.ListAPIView):
     """Admin user management endpoints"""
     permission_classes = [IsAdminUser]
+    serializer_class = UserManagementSerializer
+    pagination_class = AdminPagination
     
-    def get(self, request):
-        """List users with management data"""
+    def get_queryset(self):
+        return UserManagementSerializer.setup_eager_loading(
+            User.objects.order_by('-date_joined')
+        )
+    
+    def get(self, request, *args, **kwargs):
+        """List users with management data, one page at a time"""
         try:
-            users = User.objects.select_related('profile').all().order_by('-date_joined')
-            
-            users_data = []
-            for user in users:
-                # Get user statistics
-                total_progress = LearningProgress.objects.filter(user=user).count()
-                completed_progress = LearningProgress.objects.filter(user=user, status='completed').count()
-                study_time = LearningSession.objects.filter(user=user).aggregate(
-                    total_time=Count('duration_minutes')
-                )['total_time'] or 0
-                
-                # Calculate user level (simplified)
-                level = completed_progress // 5 + 1  # Every 5 completed lessons = 1 level
-                
-                users_data.append({
-                    'id': str(user.id),
-                    'username': user.username,
-                    'email': user.email,
-                    'firstName': user.first_name,
-                    'lastName': user.last_name,
-                    'role': 'student' if not user.is_staff else 'admin',
-                    'status': 'active' if user.is_active else 'inactive',
-                    'lastActive': user.last_login.isoformat() if user.last_login else None,
-                    'totalPoints': completed_progress * 10,  # 10 points per completion
-                    'level': level,
-                    'completedPaths': completed_progress // 10,  # Approximate paths
-                    'studyTime': study_time,
-                    'joinDate': user.date_joined.isoformat()
-                })
-            
-            serializer = UserManagementSerializer(users_data, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            return self.list(request, *args, **kwargs)
             
         except Exception as e:
             logger.error(f"Error getting users: {str(e)}")
@@ -548,15 +557,16 @@ class AdminUsersView(APIView):
         try:
             serializer = AdminUserCreateSerializer(data=request.data)
             if serializer.is_valid():
-                user = serializer.save()
-                
-                # Log the user creation
-                SystemLog.objects.create(
-                    log_type='user_registration',
-                    message=f"New user created: {user.username}",
-                    user=request.user,
-                    severity='low'
-                )
+                with transaction.atomic():
+                    user = serializer.save()
+                    
+                    # Log the user creation
+                    log_action(
+                        request,
+                        log_type='user_registration',
+                        message=f"New user created: {user.username}",
+                        severity='low'
+                    )
                 
                 return Response({
                     'status': 'success',
@@ -578,23 +588,26 @@ class AdminUsersView(APIView):
 class AdminUserDetailView(APIView):
     """Individual user management"""
     permission_classes = [IsAdminUser]
+    # Columns AdminUserUpdateSerializer and the audit log read; save() then writes only these
+    UPDATE_FIELDS = ('id', 'username', 'first_name', 'last_name', 'email', 'is_active')
     
     def patch(self, request, user_id):
         """Update user"""
         try:
-            user = User.objects.get(id=user_id)
+            user = get_object_or_404(User.objects.only(*self.UPDATE_FIELDS), pk=user_id)
             serializer = AdminUserUpdateSerializer(user, data=request.data, partial=True)
             
             if serializer.is_valid():
-                serializer.save()
-                
-                # Log the update
-                SystemLog.objects.create(
-                    log_type='system_alert',
-                    message=f"User updated: {user.username}",
-                    user=request.user,
-                    severity='medium'
-                )
+                with transaction.atomic():
+                    serializer.save()
+                    
+                    # Log the update
+                    log_action(
+                        request,
+                        log_type='system_alert',
+                        message=f"User updated: {user.username}",
+                        severity='medium'
+                    )
                 
                 return Response({
                     'status': 'success',
@@ -607,7 +620,7 @@ class AdminUserDetailView(APIView):
                     'errors': serializer.errors
                 }, status=status.HTTP_400_BAD_REQUEST)
                 
-        except User.DoesNotExist:
+        except Http404:
             return Response({'error': 'User not found'}, status=status.HTTP_404_NOT_FOUND)
         except Exception as e:
             logger.error(f"Error updating user: {str(e)}")
@@ -616,24 +629,25 @@ class AdminUserDetailView(APIView):
     def delete(self, request, user_id):
         """Delete user"""
         try:
-            user = User.objects.get(id=user_id)
+            user = get_object_or_404(User.objects.only('id', 'username'), pk=user_id)
             username = user.username
-            user.delete()
-            
-            # Log the deletion
-            SystemLog.objects.create(
-                log_type='system_alert',
-                message=f"User deleted: {username}",
-                user=request.user,
-                severity='high'
-            )
+            with transaction.atomic():
+                user.delete()
+                
+                # Log the deletion
+                log_action(
+                    request,
+                    log_type='system_alert',
+                    message=f"User deleted: {username}",
+                    severity='high'
+                )
             
             return Response({
                 'status': 'success',
                 'message': 'User deleted successfully'
             }, status=status.HTTP_200_OK)
             
-        except User.DoesNotExist:
+        except Http404:
             return Response({'error': 'User not found'}, status=status.HTTP_404_NOT_FOUND)
         except Exception as e:
             logger.error(f"Error deleting user: {str(e)}")
@@ -645,39 +659,54 @@ class AdminContentView(APIView):
     permission_classes = [IsAdminUser]
     
     def get(self, request):
-        """Get content management data"""
+        """Get content management data, streamed row by row"""
         try:
-            # Get lessons as content
-            lessons = Lesson.objects.select_related('created_by').all()
-            
-            content_data = []
-            for lesson in lessons:
-                # Calculate completion rate
-                total_progress = LearningProgress.objects.filter(lesson=lesson).count()
-                completed_progress = LearningProgress.objects.filter(lesson=lesson, status='completed').count()
-                completion_rate = (completed_progress / total_progress * 100) if total_progress > 0 else 0
-                
-                content_data.append({
-                    'id': str(lesson.id),
-                    'title': lesson.title,
-                    'type': 'lesson',
-                    'status': 'published' if lesson.is_published else 'draft',
-                    'modules': 1,  # Lessons are modules
-                    'completionRate': round(completion_rate, 2),
-                    'learners': total_progress,
-                    'avgScore': 85.0,  # Simplified
-                    'lastUpdated': lesson.updated_at.isoformat(),
-                    'createdBy': lesson.created_by.username if lesson.created_by else 'System',
-                    'difficulty': lesson.difficulty_level,
-                    'tags': [lesson.difficulty_level]
-                })
-            
-            serializer = ContentManagementSerializer(content_data, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            return StreamingHttpResponse(
+                stream_json_array(self._stream_content()), content_type='application/json'
+            )
             
         except Exception as e:
             logger.error(f"Error getting content: {str(e)}")
             return Response({'error': 'Failed to fetch content'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    
+    @staticmethod
+    def _content_queryset():
+        # Get lessons as content
+        return ContentManagementSerializer.setup_eager_loading(Lesson.objects.all())
+    
+    @classmethod
+    def get_content(cls):
+        """Every lesson with its author and learner counts"""
+        serializer = ContentManagementSerializer(cls._content_queryset(), many=True)
+        return serializer.data
+    
+    @classmethod
+    async def _stream_content(cls):
+        # Runs after get() has returned, so its try/except cannot see these
+        # errors; log them here and re-raise to abort the response
+        serializer = ContentManagementSerializer()
+        try:
+            async for lesson in cls._content_queryset().aiterator(chunk_size=STREAM_CHUNK_SIZE):
+                yield serializer.to_representation(lesson)
+        except Exception as e:
+            logger.error(f"Error streaming content: {str(e)}")
+            raise
+
+
+def _recent_months(count):
+    """First day of the current and previous months, most recent first"""
+    month_start = timezone.localdate().replace(day=1)
+    months = []
+    for _ in range(count):
+        months.append(month_start)
+        month_start = (month_start - timedelta(days=1)).replace(day=1)
+    return months
+
+
+def _rollup_average(row, total_key, count_key, default):
+    """Average from summed rollup counters, or ``default`` when there is no data"""
+    count = row.get(count_key) or 0
+    return round(row[total_key] / count, 2) if count else default
 
 
 class AdminAnalyticsView(APIView):
@@ -685,62 +714,143 @@ class AdminAnalyticsView(APIView):
     permission_classes = [IsAdminUser]
     
     def get(self, request):
-        """Get learning analytics"""
+        """Get learning analytics, streamed lesson by lesson"""
         try:
-            # Get analytics data for learning paths (simplified to lessons for now)
-            lessons = Lesson.objects.all()
+            lessons, build_row = self._analytics_builder()
+            return StreamingHttpResponse(
+                stream_json_array(self._stream_analytics(lessons, build_row)),
+                content_type='application/json'
+            )
             
-            analytics_data = []
-            for lesson in lessons:
-                total_enrollments = LearningProgress.objects.filter(lesson=lesson).count()
-                completions = LearningProgress.objects.filter(lesson=lesson, status='completed').count()
-                avg_completion_time = 30.0  # Simplified
-                avg_score = 85.0  # Simplified
-                
-                # Generate mock drop-off points (in real implementation, track actual drop-off)
-                drop_off_points = [
-                    {'stage': 'Start', 'dropOffRate': 0, 'userCount': total_enrollments},
-                    {'stage': '25%', 'dropOffRate': 15, 'userCount': int(total_enrollments * 0.85)},
-                    {'stage': '50%', 'dropOffRate': 25, 'userCount': int(total_enrollments * 0.75)},
-                    {'stage': '75%', 'dropOffRate': 30, 'userCount': int(total_enrollments * 0.70)},
-                    {'stage': 'Complete', 'dropOffRate': 35, 'userCount': completions}
-                ]
-                
-                performance_by_difficulty = {
-                    'beginner': 90.0,
-                    'intermediate': 80.0,
-                    'advanced': 75.0
-                }
-                
-                # Generate monthly progress (last 6 months)
-                monthly_progress = []
-                for i in range(6):
-                    month = (datetime.now() - timedelta(days=30*i)).strftime('%Y-%m')
-                    monthly_progress.append({
-                        'month': month,
-                        'enrollments': max(1, int(total_enrollments / 6)),
-                        'completions': max(1, int(completions / 6)),
-                        'avgScore': avg_score
-                    })
-                
-                analytics_data.append({
-                    'pathId': str(lesson.id),
-                    'pathName': lesson.title,
-                    'totalEnrollments': total_enrollments,
-                    'completions': completions,
-                    'avgCompletionTime': avg_completion_time,
-                    'avgScore': avg_score,
-                    'dropOffPoints': drop_off_points,
-                    'performanceByDifficulty': performance_by_difficulty,
-                    'monthlyProgress': monthly_progress
+        except Exception as e:
+            logger.error(f"Error getting analytics: {str(e)}")
+            return Response({'error': 'Failed to fetch analytics'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    
+    @classmethod
+    def get_analytics(cls):
+        """Per-lesson enrollment, completion and monthly progress figures"""
+        lessons, build_row = cls._analytics_builder()
+        return [build_row(lesson) for lesson in lessons]
+    
+    @staticmethod
+    async def _stream_analytics(lessons, build_row):
+        # Errors here surface mid-response, as in AdminContentView._stream_content
+        try:
+            async for lesson in lessons.aiterator(chunk_size=STREAM_CHUNK_SIZE):
+                yield build_row(lesson)
+        except Exception as e:
+            logger.error(f"Error streaming analytics: {str(e)}")
+            raise
+    
+    @staticmethod
+    def _analytics_builder():
+        """Lesson queryset plus a function turning one lesson into its analytics row
+        
+        The rollup totals are read here, once; building rows runs no queries.
+        """
+        # Get analytics data for learning paths (simplified to lessons for now)
+        lessons = Lesson.objects.only('id', 'title')
+        
+        # Totals and the last six months come from the daily rollup, not
+        # from LearningProgress
+        rollup_fields = {
+            'enrollments': Sum('enrollments'),
+            'completions': Sum('completions'),
+            'score_total': Sum('score_total'),
+            'score_count': Sum('score_count'),
+            'time_spent_total': Sum('time_spent_total'),
+        }
+        totals = {
+            row['lesson_id']: row
+            for row in LessonDailyRollup.objects.values('lesson_id').annotate(**rollup_fields)
+        }
+        months = _recent_months(6)
+        # Month labels are the same for every lesson; format them once
+        month_labels = [(month_start, month_start.strftime('%Y-%m')) for month_start in months]
+        monthly = {}
+        for row in LessonDailyRollup.objects.filter(day__gte=months[-1]).annotate(
+            month=TruncMonth('day')
+        ).values('lesson_id', 'month').annotate(**rollup_fields):
+            monthly[(row['lesson_id'], row['month'])] = row
+        
+        def build_row(lesson):
+            lesson_totals = totals.get(lesson.id, {})
+            total_enrollments = lesson_totals.get('enrollments') or 0
+            completions = lesson_totals.get('completions') or 0
+            avg_completion_time = _rollup_average(lesson_totals, 'time_spent_total', 'completions', 30.0)
+            avg_score = _rollup_average(lesson_totals, 'score_total', 'score_count', 85.0)
+            
+            # Generate mock drop-off points (in real implementation, track actual drop-off)
+            drop_off_points = [
+                {'stage': 'Start', 'dropOffRate': 0, 'userCount': total_enrollments},
+                {'stage': '25%', 'dropOffRate': 15, 'userCount': int(total_enrollments * 0.85)},
+                {'stage': '50%', 'dropOffRate': 25, 'userCount': int(total_enrollments * 0.75)},
+                {'stage': '75%', 'dropOffRate': 30, 'userCount': int(total_enrollments * 0.70)},
+                {'stage': 'Complete', 'dropOffRate': 35, 'userCount': completions}
+            ]
+            
+            performance_by_difficulty = {
+                'beginner': 90.0,
+                'intermediate': 80.0,
+                'advanced': 75.0
+            }
+            
+            # Monthly progress (last 6 months, most recent first)
+            monthly_progress = []
+            for month_start, month in month_labels:
+                month_totals = monthly.get((lesson.id, month_start), {})
+                monthly_progress.append({
+                    'month': month,
+                    'enrollments': month_totals.get('enrollments') or 0,
+                    'completions': month_totals.get('completions') or 0,
+                    'avgScore': _rollup_average(month_totals, 'score_total', 'score_count', avg_score)
                 })
             
-            serializer = LearningAnalyticsSerializer(analytics_data, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            return {
+                'pathId': str(lesson.id),
+                'pathName': lesson.title,
+                'totalEnrollments': total_enrollments,
+                'completions': completions,
+                'avgCompletionTime': avg_completion_time,
+                'avgScore': avg_score,
+                'dropOffPoints': drop_off_points,
+                'performanceByDifficulty': performance_by_difficulty,
+                'monthlyProgress': monthly_progress
+            }
+        
+        return lessons, build_row
+
+
+def _admin_dashboard_etag(request, *args, **kwargs):
+    """Changes with every tracked write, and at least once per stats cache period"""
+    stats_period = int(time.time() // ADMIN_STATS_CACHE_TIMEOUT)
+    return f'{admin_dashboard_version()}-{stats_period}'
+
+
+class AdminDashboardView(APIView):
+    """All admin dashboard panels in one response
+    
+    Clients poll with If-None-Match and get 304 Not Modified until one of
+    the sections can have changed.
+    """
+    permission_classes = [IsAdminUser]
+    
+    @method_decorator(etag(_admin_dashboard_etag))
+    def get(self, request):
+        try:
+            # First page of users, as served by AdminUsersView
+            users = AdminUsersView().get_queryset()[:AdminPagination.page_size]
+            return Response({
+                'stats': AdminStatsView.get_stats(),
+                'activity': AdminActivityView.get_activity(),
+                'users': UserManagementSerializer(users, many=True).data,
+                'content': AdminContentView.get_content(),
+                'analytics': AdminAnalyticsView.get_analytics(),
+            }, status=status.HTTP_200_OK)
             
         except Exception as e:
-            logger.error(f"Error getting analytics: {str(e)}")
-            return Response({'error': 'Failed to fetch analytics'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+            logger.error(f"Error getting admin dashboard: {str(e)}")
+            return Response({'error': 'Failed to fetch dashboard'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
 class AdminAgentsView(APIView):
@@ -750,13 +860,49 @@ class AdminAgentsView(APIView):
     def get(self, request):
         """Get AI agent status"""
         try:
-            agents = AIAgent.objects.filter(is_active=True).order_by('name')
-            serializer = AgentSerializer(agents, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            return Response(self.get_agents(), status=status.HTTP_200_OK)
             
         except Exception as e:
             logger.error(f"Error getting agents: {str(e)}")
             return Response({'error': 'Failed to fetch agents'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    
+    @classmethod
+    def get_agents(cls):
+        """Serialized active agents, cached until an agent changes"""
+        return cache.get_or_set(ADMIN_AGENTS_CACHE_KEY, cls._serialize_agents, ADMIN_AGENTS_CACHE_TIMEOUT)
+    
+    @staticmethod
+    def _serialize_agents():
+        # Plain rows formatted by hand give the same JSON as AgentListSerializer
+        agents = list(
+            AIAgent.objects.filter(is_active=True).order_by('name').values(
+                *AgentListSerializer.Meta.fields
+            )
+        )
+        for agent in agents:
+            agent['id'] = str(agent['id'])
+            if agent['last_active'] is not None:
+                # DRF's DateTimeField rendering: local time, UTC written as 'Z'
+                agent['last_active'] = timezone.localtime(agent['last_active']).isoformat().replace('+00:00', 'Z')
+        return agents
+
+
+class AdminAgentDetailView(APIView):
+    """Full configuration for a single AI agent"""
+    permission_classes = [IsAdminUser]
+    
+    def get(self, request, agent_id):
+        """Get AI agent details"""
+        try:
+            agent = AIAgent.objects.get(id=agent_id)
+            serializer = AgentDetailSerializer(agent)
+            return Response(serializer.data, status=status.HTTP_200_OK)
+            
+        except AIAgent.DoesNotExist:
+            return Response({'error': 'Agent not found'}, status=status.HTTP_404_NOT_FOUND)
+        except Exception as e:
+            logger.error(f"Error getting agent: {str(e)}")
+            return Response({'error': 'Failed to fetch agent'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
 class AdminSystemHealthView(APIView):
@@ -766,36 +912,8 @@ class AdminSystemHealthView(APIView):
     def get(self, request):
         """Get system health metrics"""
         try:
-            # Get latest system health record or create new one
-            health_record = SystemHealth.objects.order_by('-timestamp').first()
-            
-            if not health_record:
-                # Create new health record
-                cpu_usage = psutil.cpu_percent()
-                memory_usage = psutil.virtual_memory().percent
-                disk_usage = psutil.disk_usage('/').percent
-                network_latency = 50.0  # Simplified
-                active_sessions = 0
-                
-                # Calculate overall status
-                if cpu_usage < 70 and memory_usage < 80:
-                    status = 'healthy'
-                elif cpu_usage < 90 and memory_usage < 95:
-                    status = 'degraded'
-                else:
-                    status = 'unhealthy'
-                
-                health_score = max(0, 100 - (cpu_usage + memory_usage + disk_usage) / 3)
-                
-                health_record = SystemHealth.objects.create(
-                    overall_status=status,
-                    health_score=health_score,
-                    active_sessions=active_sessions,
-                    cpu_usage=cpu_usage,
-                    memory_usage=memory_usage,
-                    disk_usage=disk_usage,
-                    network_latency=network_latency
-                )
+            # Snapshot kept fresh by the refresh_system_health beat task
+            health_record = get_system_health()
             
             serializer = SystemHealthSerializer(health_record)
             return Response(serializer.data, status=status.HTTP_200_OK)
@@ -812,13 +930,25 @@ class AchievementsView(APIView):
     
     def get(self, request):
         try:
-            achievements = Achievement.objects.filter(is_active=True).order_by('difficulty', 'name')
-            serializer = AchievementSerializer(achievements, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            return Response(self.get_achievements(), status=status.HTTP_200_OK)
             
         except Exception as e:
             logger.error(f"Error getting achievements: {str(e)}")
             return Response({'error': 'Failed to fetch achievements'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    
+    @classmethod
+    def get_achievements(cls):
+        """Active achievement catalog, cached until an achievement changes"""
+        return cache.get_or_set(ACHIEVEMENTS_CACHE_KEY, cls._list_achievements, ACHIEVEMENTS_CACHE_TIMEOUT)
+    
+    @staticmethod
+    def _list_achievements():
+        # Every column is a plain str/int/bool, so the rows need no serializer pass
+        return list(
+            Achievement.objects.filter(is_active=True).order_by(
+                'difficulty', 'name'
+            ).values(*AchievementSerializer.Meta.fields)
+        )
 
 
 class UserBadgesView(APIView):
@@ -827,42 +957,71 @@ class UserBadgesView(APIView):
     
     def get(self, request, user_id):
         try:
-            user = User.objects.get(id=user_id)
-            badges = UserBadge.objects.filter(user=user).select_related('badge').order_by('-earned_at')
+            badges = UserBadgeSerializer.setup_eager_loading(
+                UserBadge.objects.filter(user_id=user_id).order_by('-earned_at')
+            )
             serializer = UserBadgeSerializer(badges, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
-            
-        except User.DoesNotExist:
-            return Response({'error': 'User not found'}, status=status.HTTP_404_NOT_FOUND)
+            data = serializer.data
+            # Only an empty result needs the extra lookup to tell "no badges" from "no user"
+            if not data and not User.objects.filter(pk=user_id).exists():
+                return Response({'error': 'User not found'}, status=status.HTTP_404_NOT_FOUND)
+            return Response(data, status=status.HTTP_200_OK)
         except Exception as e:
             logger.error(f"Error getting user badges: {str(e)}")
             return Response({'error': 'Failed to fetch user badges'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+class ConceptDetailView(APIView):
+    """Get a concept with its related concepts"""
+    permission_classes = [IsAuthenticated]
+    
+    def get(self, request, concept_id):
+        try:
+            concept = Concept.objects.filter(id=concept_id).first()
+            if concept is None:
+                return Response({'error': 'Concept not found'}, status=status.HTTP_404_NOT_FOUND)
+            
+            data = ConceptSerializer(concept).data
+            # Weight-ordered IDs from the per-concept cache the relation signals keep fresh
+            data['related_concepts'] = concept.get_related_concept_ids()
+            return Response(data, status=status.HTTP_200_OK)
+            
+        except Exception as e:
+            logger.error(f"Error getting concept: {str(e)}")
+            return Response({'error': 'Failed to fetch concept'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
 class ModuleContentView(APIView):
     """Get module content"""
     permission_classes = [IsAuthenticated]
     
     def get(self, request, module_id):
         try:
-            lesson = Lesson.objects.get(id=module_id)
+            # Only the four columns rendered below, without building a model instance
+            lesson = (
+                Lesson.objects.filter(id=module_id)
+                .values('id', 'title', 'description', 'body__content')
+                .first()
+            )
+            if lesson is None:
+                return Response({'error': 'Module not found'}, status=status.HTTP_404_NOT_FOUND)
             
             # Structure the content
             content_data = {
-                'id': str(lesson.id),
-                'title': lesson.title,
+                'id': str(lesson['id']),
+                'title': lesson['title'],
                 'type': 'lesson',
                 'content': {
                     'sections': [
                         {
                             'id': 'introduction',
                             'title': 'Introduction',
-                            'content': lesson.description
+                            'content': lesson['description']
                         },
                         {
                             'id': 'main_content',
-                            'title': lesson.title,
-                            'content': lesson.content
+                            'title': lesson['title'],
+                            'content': lesson['body__content'] or ''
                         }
                     ]
                 }
@@ -871,8 +1030,6 @@ class ModuleContentView(APIView):
             serializer = ModuleContentSerializer(content_data)
             return Response(serializer.data, status=status.HTTP_200_OK)
             
-        except Lesson.DoesNotExist:
-            return Response({'error': 'Module not found'}, status=status.HTTP_404_NOT_FOUND)
         except Exception as e:
             logger.error(f"Error getting module content: {str(e)}")
             return Response({'error': 'Failed to fetch module content'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
\ No newline at end of file
@@ -5,71 +5,79 @@ Comprehensive JaC syntax validation and testing
 
 import os
 import re
+import shutil
 import subprocess
 import sys
 from pathlib import Path
 
+# Patterns are compiled once at import instead of on every validated file.
+# They are bytes patterns so files are scanned without decoding to str first
+# Python code mixed into a walker (anti-pattern)
+PYTHON_PATTERNS = [re.compile(pattern) for pattern in (
+    rb'def\s+\w+\s*\(',
+    rb'return\s+',
+    rb'logger\.(info|debug|error)',
+    rb'except\s+',
+    rb'import\s+',
+    rb'from\s+\w+\s+import',
+    rb'if\s+__name__\s*==\s*["\']__main__["\']',
+)]
+# Proper JaC syntax
+JAC_PATTERNS = [re.compile(pattern) for pattern in (
+    rb'walker\s+\w+\s*\{',
+    rb'has\s+\w+:\s*\w*',  # Proper has declaration with colon
+    rb'can\s+\w+\s+with\s+\w+(\s+\w+)?\s*\{',
+    rb'report\s*\{',
+)]
+INCORRECT_HAS_PATTERN = re.compile(rb'has\s+\w+\s*;')
+BACKTICK_PATTERN = re.compile(rb'`.*?`')
+WALKER_PATTERN = re.compile(rb'walker\s+(\w+)\s*\{')
+
 
 def validate_jac_syntax(file_path):
     """Validate JaC syntax using regex patterns"""
     print(f"🔍 Validating: {os.path.basename(file_path)}")
     
     try:
-        with open(file_path, 'r') as f:
+        with open(file_path, 'rb') as f:
             content = f.read()
     except FileNotFoundError:
         print(f"❌ File not found: {file_path}")
         return False
     
     # Check for mixed Python code (anti-pattern)
-    python_patterns = [
-        r'def\s+\w+\s*\(',
-        r'return\s+',
-        r'logger\.(info|debug|error)',
-        r'except\s+',
-        r'import\s+',
-        r'from\s+\w+\s+import',
-        r'if\s+__name__\s*==\s*["\']__main__["\']',
-    ]
-    
     python_matches = 0
-    for pattern in python_patterns:
-        if re.search(pattern, content):
+    for pattern in PYTHON_PATTERNS:
+        if pattern.search(content):
             python_matches += 1
     
     # Check for proper JaC syntax
-    jac_patterns = [
-        r'walker\s+\w+\s*\{',
-        r'has\s+\w+:\s*\w*',  # Proper has declaration with colon
-        r'can\s+\w+\s+with\s+\w+(\s+\w+)?\s*\{',
-        r'report\s*\{',
-    ]
-    
     jac_matches = 0
-    for pattern in jac_patterns:
-        if re.search(pattern, content):
+    for pattern in JAC_PATTERNS:
+        if pattern.search(content):
             jac_matches += 1
     
     # Check for syntax errors
     syntax_errors = []
     
     # Check for incorrect has declarations (using semicolons instead of colons)
-    incorrect_has = re.findall(r'has\s+\w+\s*;', content)
+    incorrect_has = INCORRECT_HAS_PATTERN.findall(content)
     if incorrect_has:
         syntax_errors.append(f"Found {len(incorrect_has)} has declarations with semicolons instead of colons")
     
     # Check for old backtick syntax
-    backtick_usage = re.findall(r'`.*?`', content)
+    backtick_usage = BACKTICK_PATTERN.findall(content)
     if backtick_usage:
         syntax_errors.append(f"Found {len(backtick_usage)} occurrences of deprecated backtick syntax")
     
     # Check walker structure
-    walker_match = re.search(r'walker\s+(\w+)\s*\{', content)
+    walker_match = WALKER_PATTERN.search(content)
     if not walker_match:
         syntax_errors.append("No valid walker definition found")
     
     # Report results
-    print(f"   📊 Lines: {content.count(chr(10)) + 1}")
+    line_count = content.count(b'\n') + 1
+    print(f"   📊 Lines: {line_count}")
     print(f"   🔧 JaC patterns: {jac_matches}")
     print(f"   🐍 Python patterns: {python_matches}")
     print(f"   ⚠️  Syntax errors: {len(syntax_errors)}")
@@ -93,30 +101,26 @@ def test_jac_build_command():
     """Test if jac build command works"""
     print("\n🔧 Testing 'jac build' command availability...")
     
-    # Check if jac command is available
+    # Check if jac command is available (a PATH lookup, no need to fork `which`)
+    jac_path = shutil.which('jac')
+    if jac_path is None:
+        print("❌ 'jac' command not found in PATH")
+        return False
+    print(f"✅ 'jac' command found at: {jac_path}")
+    
+    # Test jac version
     try:
-        result = subprocess.run(['which', 'jac'], capture_output=True, text=True, timeout=5)
-        if result.returncode == 0:
-            jac_path = result.stdout.strip()
-            print(f"✅ 'jac' command found at: {jac_path}")
-            
-            # Test jac version
-            try:
-                version_result = subprocess.run(['jac', '--version'], capture_output=True, text=True, timeout=5)
-                if version_result.returncode == 0:
-                    print(f"📦 JaC version: {version_result.stdout.strip()}")
-                else:
-                    print(f"⚠️  'jac --version' failed: {version_result.stderr.strip()}")
-            except subprocess.TimeoutExpired:
-                print("⚠️  'jac --version' timed out")
-            
-            return True
+        version_result = subprocess.run([jac_path, '--version'], capture_output=True, text=True, timeout=5)
+        if version_result.returncode == 0:
+            print(f"📦 JaC version: {version_result.stdout.strip()}")
         else:
-            print("❌ 'jac' command not found in PATH")
-            return False
-    except (subprocess.TimeoutExpired, subprocess.SubprocessError) as e:
-        print(f"❌ Error checking 'jac' command: {e}")
-        return False
+            print(f"⚠️  'jac --version' failed: {version_result.stderr.strip()}")
+    except subprocess.TimeoutExpired:
+        print("⚠️  'jac --version' timed out")
+    except subprocess.SubprocessError as e:
+        print(f"⚠️  Error running 'jac --version': {e}")
+    
+    return True
 
 
 def test_specific_walkers():
@@ -149,7 +153,12 @@ def main():
         print(f"❌ Walker directory not found: {walker_dir}")
         return False
     
-    jac_files = [f for f in os.listdir(walker_dir) if f.endswith('.jac')]
+    # DirEntry carries the joined path and the file type from the directory read
+    with os.scandir(walker_dir) as entries:
+        jac_files = sorted(
+            entry.path for entry in entries
+            if entry.name.endswith('.jac') and entry.is_file()
+        )
     if not jac_files:
         print(f"❌ No .jac files found in {walker_dir}")
         return False
@@ -158,8 +167,7 @@ def main():
     
     # Test each file
     passed_count = 0
-    for jac_file in sorted(jac_files):
-        file_path = os.path.join(walker_dir, jac_file)
+    for file_path in jac_files:
         if validate_jac_syntax(file_path):
             passed_count += 1
         print()  # Empty line for readability
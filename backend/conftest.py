@@ -0,0 +1,91 @@
+"""
+Shared pytest fixtures for the backend test modules
+
+pytest-django sets Django up once per test session from pytest.ini, so the
+test modules import views and serializers directly instead of each running
+their own django.setup().
+"""
+
+from functools import cache
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.test import override_settings
+
+TEST_USER = {
+    "username": "frontend_test_user",
+    "email": "frontend.test@example.com",
+    "password": "TestPassword123!",
+    "first_name": "Frontend",
+    "last_name": "Tester",
+}
+
+
+@pytest.fixture(scope='session', autouse=True)
+def fast_password_hashing():
+    """Hash test passwords with MD5; the production hashers are slow on purpose
+
+    Every create_user() and login in the suite hashes a password, so this
+    dominates user setup time otherwise.
+    """
+    with override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher']):
+        yield
+
+
+@pytest.fixture(scope='session')
+def test_user(django_db_setup, django_db_blocker):
+    """One user for the whole session, shared by the login and logout tests
+
+    Created outside the per-test transactions so it is inserted once per
+    worker rather than once per test.
+    """
+    User = get_user_model()
+    with django_db_blocker.unblock():
+        # A run interrupted before teardown leaves the row in the reused database
+        User.objects.filter(username=TEST_USER["username"]).delete()
+        user = User.objects.create_user(**TEST_USER)
+    yield user
+    with django_db_blocker.unblock():
+        user.delete()
+
+
+@pytest.fixture
+def login_data():
+    """Credentials for test_user in the shape the frontend posts them
+
+    Sent as a username: LoginView hands the login field to authenticate(),
+    and ModelBackend only matches it against usernames.
+    """
+    return {
+        "username": TEST_USER["username"],
+        "password": TEST_USER["password"],
+    }
+
+
+@cache
+def view_callable(view_class):
+    """view_class.as_view(), built once per class for the whole session
+
+    The callable creates a fresh view instance per request, so it is safe to
+    reuse across tests.
+    """
+    return view_class.as_view()
+
+
+@pytest.fixture
+def post_to_view(rf):
+    """POST JSON straight to a view class and return its response
+
+    RequestFactory skips the middleware, so the request gets the session that
+    login() and logout() write to, and the CSRF exemption the test Client
+    would give it.
+    """
+    def post(view_class, path, data, user=None):
+        request = rf.post(path, data, content_type='application/json')
+        SessionMiddleware(lambda request: None).process_request(request)
+        request._dont_enforce_csrf_checks = True
+        if user is not None:
+            request.user = user  # Simulate authenticated user
+        return view_callable(view_class)(request)
+    return post
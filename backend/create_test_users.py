@@ -13,8 +13,10 @@ sys.path.append('/workspace/backend')
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'jeseci_platform.settings')
 django.setup()
 
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
-from api.models import UserProfile
+from django.db import transaction
+from api.models import UserProfile, touch_admin_dashboard
 from django.core.management.base import BaseCommand
 
 def create_test_users():
@@ -68,35 +70,49 @@ def create_test_users():
         }
     ]
     
-    created_count = 0
+    usernames = [user_data['username'] for user_data in test_users]
     
-    for user_data in test_users:
-        username = user_data['username']
-        
-        # Check if user already exists
-        if User.objects.filter(username=username).exists():
+    # One SELECT for every username instead of an exists() per user
+    existing = set(
+        User.objects.filter(username__in=usernames).values_list('username', flat=True)
+    )
+    for username in usernames:
+        if username in existing:
             print(f"❌ User '{username}' already exists - skipping")
-            continue
-        
+    
+    new_users = [user_data for user_data in test_users if user_data['username'] not in existing]
+    created_count = 0
+    
+    if new_users:
         try:
-            # Extract user profile data
-            profile_data = {
-                'learning_style': user_data.pop('learning_style'),
-                'preferred_difficulty': user_data.pop('preferred_difficulty')
-            }
-            
-            # Create user
-            user = User.objects.create_user(**user_data)
-            print(f"✅ Created user: {username}")
-            
-            # Create user profile
-            user_profile = UserProfile.objects.create(user=user, **profile_data)
-            print(f"✅ Created profile for: {username}")
-            
-            created_count += 1
-            
+            with transaction.atomic():
+                users = User.objects.bulk_create([
+                    User(
+                        username=user_data['username'],
+                        email=user_data['email'],
+                        password=make_password(user_data['password']),
+                        first_name=user_data['first_name'],
+                        last_name=user_data['last_name'],
+                        is_staff=user_data['is_staff'],
+                        is_superuser=user_data['is_superuser'],
+                    )
+                    for user_data in new_users
+                ])
+                # bulk_create skips post_save, so the profiles are created here
+                UserProfile.objects.bulk_create([
+                    UserProfile(
+                        user=user,
+                        learning_style=user_data['learning_style'],
+                        preferred_difficulty=user_data['preferred_difficulty'],
+                    )
+                    for user, user_data in zip(users, new_users)
+                ])
+            touch_admin_dashboard()
+            created_count = len(users)
+            for user in users:
+                print(f"✅ Created user and profile: {user.username}")
         except Exception as e:
-            print(f"❌ Error creating user '{username}': {str(e)}")
+            print(f"❌ Error creating test users: {str(e)}")
     
     print(f"\n📊 Summary: Successfully created {created_count} new test users")
     
@@ -104,11 +120,10 @@ def create_test_users():
         print("\n🔐 Test User Credentials:")
         print("=" * 50)
         for user_data in test_users:
-            if User.objects.filter(username=user_data['username']).exists():
-                print(f"Username: {user_data['username']}")
-                print(f"Password: {user_data['password']}")
-                print(f"Email: {user_data['email']}")
-                print("-" * 30)
+            print(f"Username: {user_data['username']}")
+            print(f"Password: {user_data['password']}")
+            print(f"Email: {user_data['email']}")
+            print("-" * 30)
 
 def print_login_instructions():
     """Print instructions for testing login"""
@@ -6,6 +6,17 @@ Final JaC Fix Summary and Verification
 import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+
+def build_jac_file(jac_file):
+    """Run `jac build` on one file; returns (result, error)"""
+    try:
+        # Output stays bytes; it is only decoded when a failure is printed
+        return subprocess.run(['jac', 'build', jac_file],
+                              capture_output=True, timeout=10), None
+    except Exception as e:
+        return None, e
 
 
 def create_final_summary():
@@ -49,26 +60,29 @@ def create_final_summary():
     
     success_count = 0
     
+    # Each build is an independent child process, so threads are enough to
+    # run them side by side; map() keeps the report in file order
+    existing_files = [jac_file for jac_file in walker_files if os.path.exists(jac_file)]
+    with ThreadPoolExecutor(max_workers=max(1, min(len(existing_files), os.cpu_count() or 1))) as executor:
+        builds = dict(zip(existing_files, executor.map(build_jac_file, existing_files)))
+    
     for jac_file in walker_files:
-        if os.path.exists(jac_file):
-            try:
-                result = subprocess.run(['jac', 'build', jac_file], 
-                                      capture_output=True, text=True, timeout=10)
-                filename = os.path.basename(jac_file)
-                
-                if result.returncode == 0 and "Errors: 0" in result.stdout:
-                    print(f"✅ {filename:25} - COMPILATION SUCCESS")
-                    success_count += 1
-                else:
-                    print(f"❌ {filename:25} - COMPILATION FAILED")
-                    print(f"   Error output: {result.stdout}")
-                    
-            except subprocess.TimeoutExpired:
-                print(f"⏰ {filename:25} - TIMEOUT")
-            except Exception as e:
-                print(f"❌ {filename:25} - ERROR: {e}")
-        else:
+        if jac_file not in builds:
             print(f"⚠️  {jac_file:25} - FILE NOT FOUND")
+            continue
+        
+        filename = os.path.basename(jac_file)
+        result, error = builds[jac_file]
+        if isinstance(error, subprocess.TimeoutExpired):
+            print(f"⏰ {filename:25} - TIMEOUT")
+        elif error is not None:
+            print(f"❌ {filename:25} - ERROR: {error}")
+        elif result.returncode == 0 and b"Errors: 0" in result.stdout:
+            print(f"✅ {filename:25} - COMPILATION SUCCESS")
+            success_count += 1
+        else:
+            print(f"❌ {filename:25} - COMPILATION FAILED")
+            print(f"   Error output: {result.stdout.decode('utf-8', 'replace')}")
     
     print("\n" + "=" * 60)
     print("🎯 FINAL RESULTS:")
@@ -66,24 +66,71 @@ TEMPLATES = [
 WSGI_APPLICATION = 'jeseci_platform.wsgi.application'
 
 # Database
+# DB_CONN_MAX_AGE keeps connections open between requests (seconds, None = forever).
+# Use it for WSGI workers. Under the ASGI server each request may run on a
+# different thread, so leave it at 0 and pool outside Django (e.g. pgbouncer in
+# transaction mode, reached over its unix socket) instead.
+DB_CONN_MAX_AGE = os.getenv('DB_CONN_MAX_AGE', '0')
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'CONN_MAX_AGE': None if DB_CONN_MAX_AGE == 'None' else int(DB_CONN_MAX_AGE),
+        # Check a reused connection is still alive before the first query of a request
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
-# Cache Configuration - Use Django's built-in cache
-CACHES = {
-    'default': {
+# Cache Configuration
+# CACHE_URL selects the backend:
+#   redis://... or unix:///path/redis.sock?db=2 -> django-redis, shared by all workers
+#   unset -> Django's per-process in-memory cache (development only)
+# SESSION_CACHE_URL does the same for the session cache and defaults to CACHE_URL;
+# point it at its own Redis database so session keys survive cache flushes.
+CACHE_URL = os.getenv('CACHE_URL', '')
+SESSION_CACHE_URL = os.getenv('SESSION_CACHE_URL', CACHE_URL)
+
+
+def cache_backend(url, location):
+    """Cache settings for ``url``, falling back to a local-memory cache"""
+    if url.startswith(('redis', 'unix')):
+        return {
+            'BACKEND': 'django_redis.cache.RedisCache',
+            'LOCATION': url,
+            'OPTIONS': {
+                'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            },
+        }
+    return {
         'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
-        'LOCATION': 'unique-snowflake',
+        'LOCATION': location,
     }
+
+
+CACHES = {
+    'default': cache_backend(CACHE_URL, 'unique-snowflake'),
+    'sessions': cache_backend(SESSION_CACHE_URL, 'sessions'),
 }
 
-# Session Configuration - Use cache backend
-SESSION_ENGINE = 'django.contrib.sessions.backends.cache'
-SESSION_CACHE_ALIAS = 'default'
+# Password hashing - Argon2 when argon2-cffi is installed. PBKDF2 stays
+# listed so existing hashes still verify and are upgraded on login.
+try:
+    import argon2  # noqa: F401
+    ARGON2_AVAILABLE = True
+except ImportError:
+    ARGON2_AVAILABLE = False
+
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+if ARGON2_AVAILABLE:
+    PASSWORD_HASHERS.insert(0, 'api.hashers.TunedArgon2PasswordHasher')
+
+# Session Configuration - Read through the session cache, write through to the database
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+SESSION_CACHE_ALIAS = 'sessions'
 
 # Internationalization
 LANGUAGE_CODE = 'en-us'
@@ -116,7 +163,7 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.AllowAny',
     ],
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'api.renderers.ORJSONRenderer',
     ],
     'DEFAULT_PARSER_CLASSES': [
         'rest_framework.parsers.JSONParser',
@@ -124,6 +171,10 @@ REST_FRAMEWORK = {
         'rest_framework.parsers.FileUploadParser',
     ],
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+    'DEFAULT_THROTTLE_RATES': {
+        # Per client IP (or user); unauthenticated endpoints that send email
+        'password_reset': '5/min',
+    },
 }
 
 # Spectacular OpenAPI Schema Configuration
@@ -168,6 +219,16 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = 'UTC'
 CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
+CELERY_BEAT_SCHEDULE = {
+    # Keeps the admin system health snapshot warm so requests only read the cache
+    'refresh-system-health': {
+        'task': 'api.tasks.refresh_system_health',
+        'schedule': 10.0,
+    },
+}
+# Reuse pooled Redis connections instead of a new TCP + AUTH handshake per op
+CELERY_BROKER_POOL_LIMIT = 10
+CELERY_REDIS_MAX_CONNECTIONS = 100
 
 # Logging Configuration
 LOGGING = {
@@ -216,9 +277,33 @@ LOGGING = {
 # Channels ASGI application
 ASGI_APPLICATION = 'jeseci_platform.asgi.application'
 
-# In-memory channel layer configuration for WebSocket support (development only)
-CHANNEL_LAYERS = {
-    'default': {
-        'BACKEND': 'channels.layers.InMemoryChannelLayer',
-    },
-}
\ No newline at end of file
+# Channel layer for WebSocket group fan-out.
+# CHANNEL_LAYER_URL selects the backend:
+#   amqp://...  -> channels_rabbitmq (one queue per server, group_add is free)
+#   redis://... -> channels_redis PubSub layer (works with Redis or DragonflyDB)
+#   unset       -> in-memory layer (development only, single process)
+CHANNEL_LAYER_URL = os.getenv('CHANNEL_LAYER_URL', '')
+if CHANNEL_LAYER_URL.startswith('amqp'):
+    CHANNEL_LAYERS = {
+        'default': {
+            'BACKEND': 'channels_rabbitmq.core.RabbitmqChannelLayer',
+            'CONFIG': {
+                'host': CHANNEL_LAYER_URL,
+            },
+        },
+    }
+elif CHANNEL_LAYER_URL.startswith('redis'):
+    CHANNEL_LAYERS = {
+        'default': {
+            'BACKEND': 'channels_redis.pubsub.RedisPubSubChannelLayer',
+            'CONFIG': {
+                'hosts': [CHANNEL_LAYER_URL],
+            },
+        },
+    }
+else:
+    CHANNEL_LAYERS = {
+        'default': {
+            'BACKEND': 'channels.layers.InMemoryChannelLayer',
+        },
+    }
\ No newline at end of file
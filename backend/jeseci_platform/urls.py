@@ -3,6 +3,8 @@ jeseci_platform URL Configuration - Enhanced with Static Files and API Root
 
 Simplified configuration for testing authentication endpoints with proper static file serving.
 """
+import json
+
 from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
@@ -12,24 +14,29 @@ from drf_spectacular.views import (
     SpectacularRedocView,
     SpectacularSwaggerView
 )
-from django.http import JsonResponse
+from django.http import HttpResponse
 from django.shortcuts import redirect
+from django.views.decorators.cache import cache_control
+
+# Static payload, so it is encoded once at import rather than on every probe
+API_ROOT_PAYLOAD = json.dumps({
+    "message": "JESECI Interactive Learning Platform API",
+    "version": "1.0.0",
+    "author": "Cavin Otieno",
+    "endpoints": {
+        "auth": "/api/auth/",
+        "admin": "/api/admin/",
+        "health": "/api/health/",
+        "docs": "/api/schema/",
+        "redoc": "/api/schema/redoc/",
+        "swagger": "/api/schema/swagger-ui/"
+    }
+}).encode('utf-8')
 
+@cache_control(public=True, max_age=300)
 def api_root(request):
     """Root API endpoint that lists available endpoints"""
-    return JsonResponse({
-        "message": "JESECI Interactive Learning Platform API",
-        "version": "1.0.0",
-        "author": "Cavin Otieno",
-        "endpoints": {
-            "auth": "/api/auth/",
-            "admin": "/api/admin/",
-            "health": "/api/health/",
-            "docs": "/api/schema/",
-            "redoc": "/api/schema/redoc/",
-            "swagger": "/api/schema/swagger-ui/"
-        }
-    })
+    return HttpResponse(API_ROOT_PAYLOAD, content_type='application/json')
 
 def root_redirect(request):
     """Redirect root path to API endpoint"""
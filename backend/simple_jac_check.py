@@ -5,65 +5,68 @@ Checks for basic structure and common syntax errors
 """
 import re
 
+# Compiled once at import instead of on every checked file; bytes patterns
+# let the file be scanned without decoding it to str first
+WALKER_PATTERN = re.compile(rb'walker\s+\w+\s*\{')
+PYTHON_FUNC_PATTERN = re.compile(rb'def\s+\w+\s*\(')
+PYTHON_ASSIGN_PATTERN = re.compile(rb'\w+\s*=\s*\w+\s*\(')
+PYTHON_LOG_PATTERN = re.compile(rb'logger\.(info|error|warning)')
+PYTHON_RETURN_PATTERN = re.compile(rb'return\s+')
+PYTHON_EXCEPT_PATTERN = re.compile(rb'except\s+Exception')
+JAC_CAN_PATTERN = re.compile(rb'can\s+\w+\s+with\s+\w+')
+JAC_REPORT_PATTERN = re.compile(rb'report\s*\{')
+
 def simple_jac_check(file_path):
     """Simple syntax check for JaC files"""
     print(f"Checking JaC file: {file_path}")
     
-    with open(file_path, 'r') as f:
+    with open(file_path, 'rb') as f:
         content = f.read()
     
     issues = []
     
     # Check for basic walker structure
-    walker_pattern = r'walker\s+\w+\s*\{'
-    if not re.search(walker_pattern, content):
+    if not WALKER_PATTERN.search(content):
         issues.append("❌ No walker definition found")
     
     # Check for Python-style function definitions
-    python_func_pattern = r'def\s+\w+\s*\('
-    if re.search(python_func_pattern, content):
+    if PYTHON_FUNC_PATTERN.search(content):
         issues.append("❌ Python-style function definitions found (should be 'can' functions)")
     
     # Check for Python-style variable assignments
-    python_assign_pattern = r'\w+\s*=\s*\w+\s*\('
-    if re.search(python_assign_pattern, content):
+    if PYTHON_ASSIGN_PATTERN.search(content):
         issues.append("❌ Python-style variable assignments found")
     
     # Check for Python logging
-    python_log_pattern = r'logger\.(info|error|warning)'
-    if re.search(python_log_pattern, content):
+    if PYTHON_LOG_PATTERN.search(content):
         issues.append("❌ Python-style logging found")
     
     # Check for Python return statements
-    python_return_pattern = r'return\s+'
-    if re.search(python_return_pattern, content):
+    if PYTHON_RETURN_PATTERN.search(content):
         issues.append("❌ Python-style return statements found (should be 'report')")
     
     # Check for Python exception handling
-    python_except_pattern = r'except\s+Exception'
-    if re.search(python_except_pattern, content):
+    if PYTHON_EXCEPT_PATTERN.search(content):
         issues.append("❌ Python-style exception handling found")
     
     # Check for proper JaC can functions
-    jac_can_pattern = r'can\s+\w+\s+with\s+\w+'
-    if not re.search(jac_can_pattern, content):
+    if not JAC_CAN_PATTERN.search(content):
         issues.append("❌ No proper JaC 'can' functions found")
     
     # Check for proper JaC report statements
-    jac_report_pattern = r'report\s*\{'
-    if not re.search(jac_report_pattern, content):
+    if not JAC_REPORT_PATTERN.search(content):
         issues.append("❌ No proper JaC 'report' statements found")
     
     # Check file structure - should not have mixed Python/JaC
-    lines = content.split('\n')
+    lines = content.split(b'\n')
     python_lines = 0
     jac_lines = 0
     
     for line in lines:
         stripped = line.strip()
-        if stripped.startswith('def ') or stripped.startswith('logger.') or stripped.startswith('return ') or stripped.startswith('except '):
+        if stripped.startswith((b'def ', b'logger.', b'return ', b'except ')):
             python_lines += 1
-        elif stripped.startswith('walker ') or stripped.startswith('can ') or stripped.startswith('report '):
+        elif stripped.startswith((b'walker ', b'can ', b'report ')):
             jac_lines += 1
     
     if python_lines > 0 and jac_lines > 0:
@@ -0,0 +1,41 @@
+"""
+Achievement Listing Tests
+Tests that the values() rows AchievementsView returns match the serializer
+
+Run from backend/ with `pytest`; Django setup comes from pytest.ini.
+"""
+
+from rest_framework.renderers import JSONRenderer
+
+from api.models import Achievement
+from api.serializers import AchievementSerializer
+from api.views import AchievementsView
+
+
+def test_achievement_rows_match_serializer(db):
+    """values() rows render to the same JSON as AchievementSerializer"""
+    Achievement.objects.create(
+        name="First Steps", description="Complete a lesson", icon="star",
+        difficulty="bronze", category="learning", points=10,
+        criteria_type="module_completion", criteria_value=1,
+    )
+    Achievement.objects.create(
+        name="On Fire", description="Keep a 7 day streak", icon="flame",
+        difficulty="silver", category="streak", rarity="rare", points=50,
+        criteria_type="streak", criteria_value=7, criteria_operator=">",
+    )
+    Achievement.objects.create(
+        name="Retired", description="No longer awarded", icon="archive",
+        difficulty="gold", category="special", criteria_type="points",
+        criteria_value=100, is_active=False,
+    )
+
+    rows = AchievementsView._list_achievements()
+    serialized = AchievementSerializer(
+        Achievement.objects.filter(is_active=True).order_by('difficulty', 'name'), many=True
+    ).data
+
+    assert rows == [dict(item) for item in serialized], "values() rows differ from the serializer output"
+    assert JSONRenderer().render(rows) == JSONRenderer().render(serialized), (
+        "values() rows render to different JSON than the serializer output"
+    )
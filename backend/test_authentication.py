@@ -5,9 +5,6 @@ Test authentication endpoints directly
 
 import os
 import sys
-import django
-import requests
-import json
 from datetime import timedelta
 
 # Setup Django environment
@@ -18,6 +15,9 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'jeseci_platform.settings')
 import django
 from django.conf import settings
 
+# The database listing is opt-in: `python test_authentication.py --db`
+USE_DB = '--db' in sys.argv[1:]
+
 # Set a minimal configuration that avoids jaclang issues
 if not settings.configured:
     settings.configure(
@@ -31,7 +31,8 @@ if not settings.configured:
         DATABASES={
             'default': {
                 'ENGINE': 'django.db.backends.sqlite3',
-                'NAME': '/workspace/backend/db.sqlite3',
+                # The JWT-only run never reads users, so it gets no file on disk
+                'NAME': '/workspace/backend/db.sqlite3' if USE_DB else ':memory:',
             }
         },
         REST_FRAMEWORK={
@@ -53,73 +54,107 @@ django.setup()
 from django.contrib.auth.models import User
 from rest_framework_simplejwt.tokens import RefreshToken
 
-def test_authentication():
-    """Test basic authentication functionality"""
+def print_traceback():
+    """Print the current exception's traceback when TEST_VERBOSE=1 is set"""
+    if os.environ.get('TEST_VERBOSE') == '1':
+        import traceback
+        traceback.print_exc()
+    else:
+        print("   (set TEST_VERBOSE=1 to print the traceback)")
+
+def check_jwt_tokens(test_user):
+    """Generate a token pair for test_user and validate the access token"""
+    print(f"\n🔐 Testing JWT token generation for: {test_user.username}")
+    
+    # Generate tokens
+    refresh = RefreshToken.for_user(test_user)
+    access_token = str(refresh.access_token)
+    
+    print(f"✅ Access Token: {access_token[:50]}...")
+    print(f"✅ Refresh Token: {str(refresh)[:50]}...")
+    
+    # Test token validation
+    from rest_framework_simplejwt.authentication import JWTAuthentication
+    
+    auth = JWTAuthentication()
+    try:
+        validated_token = auth.get_validated_token(access_token)
+        print(f"✅ Token validation successful")
+        print(f"   - User ID: {validated_token.get('user_id')}")
+        print(f"   - Username: {validated_token.get('username')}")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Token validation failed: {str(e)}")
+        return False
+
+def test_jwt_only():
+    """Test JWT signing and validation without touching the database"""
     
-    print("🧪 Testing Authentication System")
+    print("🧪 Testing Authentication System (JWT only)")
     print("=" * 50)
     
     try:
-        # Test if users exist
-        users = User.objects.all()
+        # Token generation only reads the user's ID, so an unsaved user will do
+        test_user = User(pk=1, username='jwt_test_user')
+        if not check_jwt_tokens(test_user):
+            return False
+        
+        print(f"\n🎉 Authentication system is working correctly!")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Authentication test failed: {str(e)}")
+        print_traceback()
+        return False
+
+def test_db_smoke():
+    """Test authentication against the users stored in the database"""
+    
+    print("🧪 Testing Authentication System (database)")
+    print("=" * 50)
+    
+    try:
+        # Test if users exist (read-only, nothing is written)
+        users = User.objects.order_by('pk')
         print(f"📊 Total users in database: {users.count()}")
         
-        for user in users[:4]:  # Show first 4 users
+        # The profile relation only exists when the api app is installed;
+        # join it then rather than querying it once per user below
+        if any(rel.name == 'profile' for rel in User._meta.related_objects):
+            users = users.select_related('profile')
+        users_page = list(users[:4])  # Show first 4 users
+        
+        for user in users_page:
             print(f"✅ User: {user.username} ({user.email})")
-            if hasattr(user, 'userprofile'):
-                profile = user.userprofile
+            if hasattr(user, 'profile'):
+                profile = user.profile
                 print(f"   - Learning Style: {profile.learning_style}")
                 print(f"   - Preferred Difficulty: {profile.preferred_difficulty}")
         
         # Test JWT token generation
-        test_user = users.first()
-        if test_user:
-            print(f"\n🔐 Testing JWT token generation for: {test_user.username}")
-            
-            # Generate tokens
-            refresh = RefreshToken.for_user(test_user)
-            access_token = str(refresh.access_token)
-            
-            print(f"✅ Access Token: {access_token[:50]}...")
-            print(f"✅ Refresh Token: {str(refresh)[:50]}...")
-            
-            # Test token validation
-            from rest_framework_simplejwt.authentication import JWTAuthentication
-            from rest_framework_simplejwt.exceptions import InvalidToken
-            
-            auth = JWTAuthentication()
-            try:
-                # Mock request object
-                class MockRequest:
-                    def __init__(self):
-                        self.META = {
-                            'HTTP_AUTHORIZATION': f'Bearer {access_token}'
-                        }
-                
-                validated_token = auth.get_validated_token(access_token)
-                print(f"✅ Token validation successful")
-                print(f"   - User ID: {validated_token.get('user_id')}")
-                print(f"   - Username: {validated_token.get('username')}")
-                
-            except Exception as e:
-                print(f"❌ Token validation failed: {str(e)}")
+        test_user = users_page[0] if users_page else None
+        if test_user and not check_jwt_tokens(test_user):
+            return False
         
         print(f"\n🎉 Authentication system is working correctly!")
         return True
         
     except Exception as e:
         print(f"❌ Authentication test failed: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        print_traceback()
         return False
 
 if __name__ == '__main__':
-    success = test_authentication()
+    success = test_db_smoke() if USE_DB else test_jwt_only()
     
     if success:
         print("\n🚀 Next Steps:")
         print("1. The authentication endpoints are ready")
-        print("2. Users exist in the database")
+        if USE_DB:
+            print("2. Users exist in the database")
+        else:
+            print("2. Run with --db to check the users in the database")
         print("3. JWT token generation works")
         print("4. You can now start the Django server and test login")
         print("\nTo start the server:")
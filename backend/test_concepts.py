@@ -0,0 +1,69 @@
+"""
+Concept Relation Tests
+Tests that related concepts stay symmetric and their cached lists stay fresh
+
+Run from backend/ with `pytest`; Django setup comes from pytest.ini.
+"""
+
+import pytest
+
+from api.models import Concept, ConceptRelation
+
+
+@pytest.fixture
+def concepts(db):
+    return [
+        Concept.objects.create(
+            name=name, description=name, category="programming", difficulty_level="beginner"
+        )
+        for name in ("Variables", "Loops", "Functions")
+    ]
+
+
+def test_manager_changes_refresh_cache(concepts):
+    """add(), remove() and clear() reach the cached lists on both ends"""
+    a, b, c = concepts
+    assert a.get_related_concept_ids() == []
+    assert b.get_related_concept_ids() == []
+
+    a.related_concepts.add(b, c)
+    assert sorted(a.get_related_concept_ids()) == sorted([str(b.pk), str(c.pk)])
+    assert b.get_related_concept_ids() == [str(a.pk)]
+
+    a.related_concepts.remove(b)
+    assert a.get_related_concept_ids() == [str(c.pk)]
+    assert b.get_related_concept_ids() == []
+
+    a.related_concepts.clear()
+    assert a.get_related_concept_ids() == []
+    assert c.get_related_concept_ids() == []
+
+
+def test_direct_relation_saves_are_mirrored(concepts):
+    """Saving or deleting one edge row does the same to its reverse"""
+    a, b, _ = concepts
+    relation = ConceptRelation.objects.create(from_concept=a, to_concept=b, weight=0.5)
+    assert b.get_related_concept_ids() == [str(a.pk)]
+    assert ConceptRelation.objects.get(from_concept=b, to_concept=a).weight == 0.5
+
+    relation.weight = 0.9
+    relation.save()
+    assert ConceptRelation.objects.get(from_concept=b, to_concept=a).weight == 0.9
+
+    relation.delete()
+    assert not ConceptRelation.objects.exists()
+    assert b.get_related_concept_ids() == []
+
+
+def test_concept_detail_lists_related(client, django_user_model, concepts):
+    """The concept detail payload carries the weight-ordered related IDs"""
+    a, b, c = concepts
+    a.related_concepts.add(b, through_defaults={"weight": 0.2})
+    a.related_concepts.add(c, through_defaults={"weight": 0.8})
+    client.force_login(django_user_model.objects.create_user("concept_reader", password="x"))
+
+    response = client.get(f"/api/api/concepts/{a.pk}/")
+
+    assert response.status_code == 200
+    assert response.data["name"] == "Variables"
+    assert response.data["related_concepts"] == [str(c.pk), str(b.pk)]
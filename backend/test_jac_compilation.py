@@ -23,22 +23,34 @@ except ImportError as e:
     sys.exit(1)
 
 
+# Built on first use and shared by every file: creating a parser builds the
+# grammar tables, which costs far more than parsing one walker
+_PARSER = None
+
+
+def _get_parser():
+    """The shared JacParser, created on the first call"""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = JacParser()
+        print("✅ JacParser created successfully")
+    return _PARSER
+
+
 def test_jac_compilation(jac_file_path):
     """Test JaC file compilation"""
     print(f"\n🔧 Testing JaC compilation: {jac_file_path}")
     
     try:
         # Read the JaC file
-        with open(jac_file_path, 'r') as f:
-            jac_code = f.read()
+        jac_code = Path(jac_file_path).read_bytes().decode('utf-8')
         
         print(f"📄 File size: {len(jac_code)} characters")
         
         # Try to parse the JaC code
         try:
-            # Create parser instance
-            parser = JacParser()
-            print("✅ JacParser created successfully")
+            # Reuse the parser instance across files
+            parser = _get_parser()
             
             # Try to parse the code
             # This might not work directly but let's try
@@ -67,18 +79,22 @@ def main():
     # Find all .jac files
     jac_files = []
     if os.path.exists(walker_dir):
-        jac_files = [f for f in os.listdir(walker_dir) if f.endswith('.jac')]
+        # DirEntry carries the joined path and the file type from the directory read
+        with os.scandir(walker_dir) as entries:
+            jac_files = sorted(
+                (entry for entry in entries if entry.name.endswith('.jac') and entry.is_file()),
+                key=lambda entry: entry.name
+            )
     
     print(f"🎯 Testing compilation of {len(jac_files)} JaC walker files")
     
     success_count = 0
-    for jac_file in sorted(jac_files):
-        file_path = os.path.join(walker_dir, jac_file)
+    for jac_file in jac_files:
         try:
-            if test_jac_compilation(file_path):
+            if test_jac_compilation(jac_file.path):
                 success_count += 1
         except Exception as e:
-            print(f"❌ Failed to test {jac_file}: {e}")
+            print(f"❌ Failed to test {jac_file.name}: {e}")
     
     print(f"\n📊 Compilation Test Results: {success_count}/{len(jac_files)} files processed")
 
@@ -0,0 +1,33 @@
+"""
+Relation Model Manager Tests
+Tests the plain default managers and the opt-in with_related joins
+
+Run from backend/ with `pytest`; Django setup comes from pytest.ini.
+"""
+
+import pytest
+
+from api.models import Lesson, LearningProgress
+
+
+@pytest.fixture
+def progress(admin_user):
+    lesson = Lesson.objects.create(
+        title="Intro", description="Basics", difficulty_level="beginner",
+        estimated_duration=10, created_by=admin_user,
+    )
+    return LearningProgress.objects.create(user=admin_user, lesson=lesson)
+
+
+def test_default_manager_allows_deferral(progress, django_assert_num_queries):
+    """only() on objects works and loads no related rows"""
+    with django_assert_num_queries(1):
+        statuses = [row.status for row in LearningProgress.objects.only('status')]
+    assert statuses == ['not_started']
+
+
+def test_with_related_joins_foreign_keys(progress, django_assert_num_queries):
+    """with_related reads the user and lesson in the same query"""
+    with django_assert_num_queries(1):
+        row = LearningProgress.with_related.get(pk=progress.pk)
+        assert (row.user.username, row.lesson.title) == (progress.user.username, "Intro")
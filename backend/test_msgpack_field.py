@@ -0,0 +1,68 @@
+"""
+MessagePack Field Tests
+Tests that MsgpackField values survive full_clean() and the admin change form
+
+Run from backend/ with `pytest`; Django setup comes from pytest.ini.
+"""
+
+import pytest
+from django.core.exceptions import ValidationError
+
+from api.fields import MsgpackField
+from api.models import Concept, UserMastery
+
+HISTORY = [{"score": 0.8, "tags": ["loops", "recursion"]}]
+
+
+@pytest.fixture
+def mastery(admin_user):
+    concept = Concept.objects.create(
+        name="Recursion", description="Functions calling themselves",
+        category="algorithms", difficulty_level="intermediate",
+    )
+    return UserMastery(user=admin_user, concept=concept)
+
+
+def test_full_clean_round_trip(mastery):
+    """A cleaned and saved value reads back unchanged"""
+    mastery.assessment_history = HISTORY
+    mastery.full_clean()
+    mastery.save()
+
+    assert UserMastery.objects.get(pk=mastery.pk).assessment_history == HISTORY
+
+
+def test_invalid_blob_is_a_validation_error():
+    """Undecodable input fails validation instead of raising a server error"""
+    field = MsgpackField()
+    for value in ["[{'a': 1}]", b"\xc1"]:
+        with pytest.raises(ValidationError):
+            field.to_python(value)
+
+
+def test_admin_change_form_edits_json(admin_client, mastery):
+    """The admin form takes JSON text and stores it packed"""
+    mastery.assessment_history = [{"score": 0.1}]
+    mastery.save()
+    url = f"/admin/api/usermastery/{mastery.pk}/change/"
+
+    form = admin_client.get(url).context["adminform"].form
+    assert form.initial["assessment_history"] == [{"score": 0.1}]
+
+    data = {
+        "user": mastery.user_id,
+        "concept": mastery.concept_id,
+        "mastery_level": "0.5",
+        "confidence_level": "0.5",
+        "last_assessment_0": "2026-01-01",
+        "last_assessment_1": "12:00:00",
+        "assessment_history": '[{"score": 0.8, "tags": ["loops", "recursion"]}]',
+    }
+    response = admin_client.post(url, data)
+    assert response.status_code == 302, response.context["adminform"].form.errors
+    mastery.refresh_from_db()
+    assert mastery.assessment_history == HISTORY
+
+    response = admin_client.post(url, {**data, "assessment_history": "[{'a': 1}]"})
+    assert response.status_code == 200, "Invalid JSON was not reported as a form error"
+    assert "assessment_history" in response.context["adminform"].form.errors
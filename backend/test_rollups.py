@@ -0,0 +1,74 @@
+"""
+Lesson Rollup Tests
+Tests that the daily lesson rollup matches a full rebuild after every change
+
+Run from backend/ with `pytest`; Django setup comes from pytest.ini.
+"""
+
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from api.models import Lesson, LearningProgress, LessonDailyRollup
+
+COUNTERS = ('lesson_id', 'day', 'enrollments', 'completions', 'score_total', 'score_count', 'time_spent_total')
+
+
+def rollup_rows():
+    return sorted(LessonDailyRollup.objects.values_list(*COUNTERS), key=str)
+
+
+def assert_matches_rebuild():
+    """The signal-maintained rows equal what rebuild_learning_rollups produces"""
+    maintained = rollup_rows()
+    call_command('rebuild_learning_rollups', stdout=StringIO())
+    assert maintained == rollup_rows()
+
+
+@pytest.fixture
+def lesson(admin_user):
+    return Lesson.objects.create(
+        title="Intro", description="Basics", difficulty_level="beginner",
+        estimated_duration=10, created_by=admin_user,
+    )
+
+
+def test_recompletion_counts_once(admin_user, lesson):
+    """completed -> in_progress -> completed leaves one completion"""
+    progress = LearningProgress.objects.create(user=admin_user, lesson=lesson, time_spent=5)
+    for status in ('completed', 'in_progress', 'completed'):
+        progress.status = status
+        progress.save()
+
+    rollup = LessonDailyRollup.objects.get(lesson=lesson)
+    assert (rollup.enrollments, rollup.completions, rollup.time_spent_total) == (1, 1, 5)
+    assert_matches_rebuild()
+
+
+def test_delete_removes_counts(admin_user, django_user_model, lesson):
+    """Deleting a progress row takes its enrollment and completion out"""
+    other = django_user_model.objects.create_user("rollup_learner", password="x")
+    kept = LearningProgress.objects.create(user=other, lesson=lesson)
+    removed = LearningProgress.objects.create(
+        user=admin_user, lesson=lesson, status='completed', quiz_score=80.0
+    )
+    assert removed.completed_at is not None, "Completion was not dated"
+
+    removed.delete()
+
+    rollup = LessonDailyRollup.objects.get(lesson=lesson)
+    assert (rollup.enrollments, rollup.completions, rollup.score_count) == (1, 0, 0)
+    kept.delete()
+    assert not LessonDailyRollup.objects.exists()
+
+
+def test_deferred_load_recounts_old_day(admin_user, lesson):
+    """A row loaded without its status still moves out of its old day"""
+    progress = LearningProgress.objects.create(user=admin_user, lesson=lesson, status='completed')
+    stale = LearningProgress.objects.only('id', 'lesson_id').get(pk=progress.pk)
+    stale.status = 'in_progress'
+    stale.save()
+
+    assert LessonDailyRollup.objects.get(lesson=lesson).completions == 0
+    assert_matches_rebuild()
@@ -1,583 +1,93 @@
-#!/usr/bin/env python3
 """
-Simple Authentication Testing Script
-Tests core authentication functionality without complex Django setup
-"""
-
-import os
-import sys
-import json
-from datetime import datetime
+Simple Authentication Tests
+Tests core authentication functionality against frontend expectations
 
-# Add backend to path
-sys.path.insert(0, '/workspace/backend')
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'jeseci_platform.settings')
-
-# Configure Django before imports
-import django
-django.setup()
+Run from backend/ with `pytest`; Django setup and the shared test_user,
+login_data and post_to_view fixtures come from pytest.ini and conftest.py.
+"""
 
-# Now import Django components
-from django.contrib.auth.models import User
-from django.test import RequestFactory
-from api.views import LoginView, RegisterView, LogoutView
+from api.views import LoginView, RegisterView
 from api.serializers import LoginSerializer, RegisterSerializer
-import django.contrib.auth
-
-class SimpleAuthTester:
-    def __init__(self):
-        self.factory = RequestFactory()
-        self.test_results = {
-            "total_tests": 0,
-            "passed_tests": 0,
-            "failed_tests": 0,
-            "test_details": []
-        }
-
-    def log_test(self, test_name, success, message, details=None):
-        """Log test results"""
-        self.test_results["total_tests"] += 1
-        
-        if success:
-            self.test_results["passed_tests"] += 1
-            print(f"✅ {test_name}: SUCCESS - {message}")
-        else:
-            self.test_results["failed_tests"] += 1
-            print(f"❌ {test_name}: FAILED - {message}")
-        
-        test_detail = {
-            "test_name": test_name,
-            "success": success,
-            "message": message,
-            "timestamp": datetime.now().isoformat()
-        }
-        if details:
-            test_detail["details"] = details
-        
-        self.test_results["test_details"].append(test_detail)
-
-    def create_test_user(self):
-        """Create a test user"""
-        try:
-            # Clean up any existing test user
-            User.objects.filter(username="frontend_test_user").delete()
-            
-            # Create test user
-            test_user = User.objects.create_user(
-                username="frontend_test_user",
-                email="frontend.test@example.com",
-                password="TestPassword123!",
-                first_name="Frontend",
-                last_name="Tester"
-            )
-            
-            print(f"👤 Created test user: {test_user.username} (ID: {test_user.id})")
-            return test_user
-        except Exception as e:
-            print(f"❌ Failed to create test user: {str(e)}")
-            return None
-
-    def test_user_creation(self):
-        """Test that we can create users in the database"""
-        print("\n👤 Testing User Creation")
-        print("=" * 50)
-        
-        try:
-            user_count_before = User.objects.count()
-            test_user = self.create_test_user()
-            
-            if test_user:
-                user_count_after = User.objects.count()
-                
-                if user_count_after > user_count_before:
-                    self.log_test(
-                        "User Creation", 
-                        True, 
-                        "Successfully created test user in database",
-                        {"user_id": test_user.id, "username": test_user.username}
-                    )
-                else:
-                    self.log_test(
-                        "User Creation", 
-                        False, 
-                        "User creation didn't increase database count"
-                    )
-                
-                # Test user authentication
-                if test_user.check_password("TestPassword123!"):
-                    self.log_test(
-                        "User Authentication", 
-                        True, 
-                        "Test user can authenticate with correct password"
-                    )
-                else:
-                    self.log_test(
-                        "User Authentication", 
-                        False, 
-                        "Test user cannot authenticate"
-                    )
-            else:
-                self.log_test(
-                    "User Creation", 
-                    False, 
-                    "Could not create test user"
-                )
-        
-        except Exception as e:
-            self.log_test(
-                "User Creation", 
-                False, 
-                f"Exception during user creation: {str(e)}"
-            )
-
-    def test_login_serializer(self):
-        """Test login serializer with frontend data"""
-        print("\n🔐 Testing Login Serializer")
-        print("=" * 50)
-        
-        # Test data that frontend would send
-        login_data = {
-            "email": "frontend.test@example.com",
-            "password": "TestPassword123!"
-        }
-        
-        try:
-            serializer = LoginSerializer(data=login_data)
-            
-            if serializer.is_valid():
-                user = serializer.validated_data['user']
-                self.log_test(
-                    "Login Serializer - Validation", 
-                    True, 
-                    "LoginSerializer validates frontend data correctly",
-                    {"user_id": user.id, "username": user.username}
-                )
-                
-                # Check that the user data matches our test user
-                if user.username == "frontend_test_user":
-                    self.log_test(
-                        "Login Serializer - User Match", 
-                        True, 
-                        "Serializer found correct user"
-                    )
-                else:
-                    self.log_test(
-                        "Login Serializer - User Match", 
-                        False, 
-                        f"Serializer found wrong user: {user.username}"
-                    )
-            else:
-                self.log_test(
-                    "Login Serializer - Validation", 
-                    False, 
-                    f"Serializer validation failed: {serializer.errors}"
-                )
-        
-        except Exception as e:
-            self.log_test(
-                "Login Serializer - Validation", 
-                False, 
-                f"Exception in login serializer: {str(e)}"
-            )
-
-    def test_register_serializer(self):
-        """Test register serializer with frontend data"""
-        print("\n🧪 Testing Register Serializer")
-        print("=" * 50)
-        
-        # Test data that frontend would send
-        register_data = {
-            "username": "new_frontend_user",
-            "email": "new.frontend@example.com",
-            "password": "NewUserPassword123!",
-            "first_name": "New",
-            "last_name": "User",
-            "learning_style": "visual",
-            "preferred_difficulty": "intermediate"
-        }
-        
-        try:
-            serializer = RegisterSerializer(data=register_data)
-            
-            if serializer.is_valid():
-                user = serializer.save()
-                self.log_test(
-                    "Register Serializer - Validation", 
-                    True, 
-                    "RegisterSerializer validates and saves frontend data correctly",
-                    {
-                        "user_id": user.id, 
-                        "username": user.username,
-                        "email": user.email,
-                        "first_name": user.first_name,
-                        "last_name": user.last_name
-                    }
-                )
-                
-                # Clean up the created user
-                try:
-                    user.delete()
-                    self.log_test(
-                        "Register Serializer - Cleanup", 
-                        True, 
-                        "Successfully cleaned up test user"
-                    )
-                except:
-                    self.log_test(
-                        "Register Serializer - Cleanup", 
-                        False, 
-                        "Could not clean up test user"
-                    )
-            else:
-                self.log_test(
-                    "Register Serializer - Validation", 
-                    False, 
-                    f"RegisterSerializer validation failed: {serializer.errors}"
-                )
-        
-        except Exception as e:
-            self.log_test(
-                "Register Serializer - Validation", 
-                False, 
-                f"Exception in register serializer: {str(e)}"
-            )
-
-    def test_login_view_structure(self):
-        """Test that LoginView returns the expected structure"""
-        print("\n🔐 Testing LoginView Response Structure")
-        print("=" * 50)
-        
-        # Create test user first
-        test_user = self.create_test_user()
-        if not test_user:
-            self.log_test("LoginView - Structure", False, "Cannot test without test user")
-            return
-        
-        try:
-            # Create request
-            login_data = {
-                "email": "frontend.test@example.com",
-                "password": "TestPassword123!"
-            }
-            
-            request = self.factory.post('/api/auth/login/', login_data, content_type='application/json')
-            
-            # Call view
-            view = LoginView.as_view()
-            response = view(request)
-            
-            # Check response
-            print(f"📥 Response Status: {response.status_code}")
-            
-            if response.status_code == 200:
-                try:
-                    response_data = json.loads(response.content)
-                    
-                    # Check expected structure
-                    required_fields = ['status', 'message', 'data']
-                    missing_fields = [field for field in required_fields if field not in response_data]
-                    
-                    if not missing_fields:
-                        self.log_test(
-                            "LoginView - Required Fields", 
-                            True, 
-                            "LoginView response contains all required fields"
-                        )
-                        
-                        # Check data structure
-                        if 'data' in response_data:
-                            data = response_data['data']
-                            if 'tokens' in data and 'user' in data:
-                                tokens = data['tokens']
-                                if 'access' in tokens and 'refresh' in tokens:
-                                    self.log_test(
-                                        "LoginView - Token Structure", 
-                                        True, 
-                                        "LoginView returns proper token structure for frontend",
-                                        {
-                                            "has_access_token": bool(tokens['access']),
-                                            "access_token_length": len(tokens['access']) if tokens['access'] else 0,
-                                            "has_refresh_token": bool(tokens['refresh']),
-                                            "refresh_token_length": len(tokens['refresh']) if tokens['refresh'] else 0
-                                        }
-                                    )
-                                else:
-                                    self.log_test(
-                                        "LoginView - Token Structure", 
-                                        False, 
-                                        "LoginView missing access or refresh token"
-                                    )
-                            else:
-                                self.log_test(
-                                    "LoginView - Token Structure", 
-                                    False, 
-                                    "LoginView missing tokens or user in data"
-                                )
-                        else:
-                            self.log_test(
-                                "LoginView - Required Fields", 
-                                False, 
-                                "LoginView missing data field"
-                            )
-                    else:
-                        self.log_test(
-                            "LoginView - Required Fields", 
-                            False, 
-                            f"LoginView missing required fields: {missing_fields}"
-                        )
-                
-                except json.JSONDecodeError:
-                    self.log_test(
-                        "LoginView - Response Format", 
-                        False, 
-                        "LoginView response is not valid JSON"
-                    )
-            else:
-                self.log_test(
-                    "LoginView - Response Status", 
-                    False, 
-                    f"LoginView returned unexpected status: {response.status_code}"
-                )
-        
-        except Exception as e:
-            self.log_test(
-                "LoginView - Structure", 
-                False, 
-                f"Exception testing LoginView: {str(e)}"
-            )
-
-    def test_register_view_structure(self):
-        """Test that RegisterView returns the expected structure"""
-        print("\n🧪 Testing RegisterView Response Structure")
-        print("=" * 50)
-        
-        try:
-            # Create request
-            register_data = {
-                "username": "frontend_register_test",
-                "email": "frontend.register@example.com",
-                "password": "FrontendTest123!",
-                "first_name": "Frontend",
-                "last_name": "Register",
-                "learning_style": "auditory",
-                "preferred_difficulty": "advanced"
-            }
-            
-            request = self.factory.post('/api/auth/register/', register_data, content_type='application/json')
-            
-            # Call view
-            view = RegisterView.as_view()
-            response = view(request)
-            
-            # Check response
-            print(f"📥 Response Status: {response.status_code}")
-            
-            if response.status_code == 201:
-                try:
-                    response_data = json.loads(response.content)
-                    
-                    # Check expected structure
-                    required_fields = ['status', 'message', 'data']
-                    missing_fields = [field for field in required_fields if field not in response_data]
-                    
-                    if not missing_fields:
-                        self.log_test(
-                            "RegisterView - Required Fields", 
-                            True, 
-                            "RegisterView response contains all required fields"
-                        )
-                        
-                        # Check data structure
-                        if 'data' in response_data:
-                            data = response_data['data']
-                            if 'tokens' in data and 'user' in data:
-                                tokens = data['tokens']
-                                if 'access' in tokens and 'refresh' in tokens:
-                                    self.log_test(
-                                        "RegisterView - Token Structure", 
-                                        True, 
-                                        "RegisterView returns proper token structure for frontend",
-                                        {
-                                            "has_access_token": bool(tokens['access']),
-                                            "has_refresh_token": bool(tokens['refresh'])
-                                        }
-                                    )
-                                else:
-                                    self.log_test(
-                                        "RegisterView - Token Structure", 
-                                        False, 
-                                        "RegisterView missing access or refresh token"
-                                    )
-                            else:
-                                self.log_test(
-                                    "RegisterView - Token Structure", 
-                                    False, 
-                                    "RegisterView missing tokens or user in data"
-                                )
-                        else:
-                            self.log_test(
-                                "RegisterView - Required Fields", 
-                                False, 
-                                "RegisterView missing data field"
-                            )
-                    else:
-                        self.log_test(
-                            "RegisterView - Required Fields", 
-                            False, 
-                            f"RegisterView missing required fields: {missing_fields}"
-                        )
-                
-                except json.JSONDecodeError:
-                    self.log_test(
-                        "RegisterView - Response Format", 
-                        False, 
-                        "RegisterView response is not valid JSON"
-                    )
-            else:
-                self.log_test(
-                    "RegisterView - Response Status", 
-                    False, 
-                    f"RegisterView returned unexpected status: {response.status_code}"
-                )
-        
-        except Exception as e:
-            self.log_test(
-                "RegisterView - Structure", 
-                False, 
-                f"Exception testing RegisterView: {str(e)}"
-            )
-
-    def test_frontend_integration_check(self):
-        """Test that the authentication system matches frontend expectations"""
-        print("\n🌐 Testing Frontend Integration Compatibility")
-        print("=" * 50)
-        
-        # Frontend expects these patterns:
-        expected_patterns = [
-            ("Status field present", "login/response/status", True),
-            ("Success status value", "login/response/status_value", "success"),
-            ("Data field present", "login/response/data", True),
-            ("Tokens in data", "login/response/data/tokens", True),
-            ("Access token", "login/response/data/tokens/access", True),
-            ("Refresh token", "login/response/data/tokens/refresh", True),
-            ("User data", "login/response/data/user", True),
-            ("User ID", "login/response/data/user/id", True),
-            ("User email", "login/response/data/user/email", True),
-        ]
-        
-        # Test database users
-        try:
-            test_user_count = User.objects.filter(username="frontend_test_user").count()
-            if test_user_count > 0:
-                self.log_test(
-                    "Frontend Integration - Database", 
-                    True, 
-                    "Authentication system can create and manage users",
-                    {"test_users_created": test_user_count}
-                )
-            else:
-                self.log_test(
-                    "Frontend Integration - Database", 
-                    False, 
-                    "No test users found in database"
-                )
-        except Exception as e:
-            self.log_test(
-                "Frontend Integration - Database", 
-                False, 
-                f"Database test failed: {str(e)}"
-            )
-        
-        # Test token generation capability
-        try:
-            test_user = User.objects.get(username="frontend_test_user")
-            from rest_framework_simplejwt.tokens import RefreshToken
-            
-            refresh = RefreshToken.for_user(test_user)
-            access_token = str(refresh.access_token)
-            refresh_token = str(refresh)
-            
-            self.log_test(
-                "Frontend Integration - Token Generation", 
-                True, 
-                "JWT token generation works correctly",
-                {
-                    "access_token_prefix": access_token[:20] + "..." if len(access_token) > 20 else access_token,
-                    "refresh_token_prefix": refresh_token[:20] + "..." if len(refresh_token) > 20 else refresh_token
-                }
-            )
-        except Exception as e:
-            self.log_test(
-                "Frontend Integration - Token Generation", 
-                False, 
-                f"Token generation failed: {str(e)}"
-            )
-
-    def run_all_tests(self):
-        """Run all authentication tests"""
-        print("🚀 Starting Simple Authentication Testing")
-        print("=" * 60)
-        print(f"Test Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("Testing authentication system compatibility with frontend")
-        print("=" * 60)
-        
-        # Run tests
-        self.test_user_creation()
-        self.test_login_serializer()
-        self.test_register_serializer()
-        self.test_login_view_structure()
-        self.test_register_view_structure()
-        self.test_frontend_integration_check()
-        
-        # Print summary
-        print("\n" + "=" * 60)
-        print("🎯 TEST SUMMARY")
-        print("=" * 60)
-        print(f"Total Tests: {self.test_results['total_tests']}")
-        print(f"✅ Passed: {self.test_results['passed_tests']}")
-        print(f"❌ Failed: {self.test_results['failed_tests']}")
-        print(f"Success Rate: {(self.test_results['passed_tests'] / max(self.test_results['total_tests'], 1) * 100):.1f}%")
-        
-        if self.test_results['failed_tests'] == 0:
-            print("\n🎉 ALL TESTS PASSED!")
-            print("✅ Authentication system is fully compatible with frontend!")
-            print("✅ Users can register, login, and logout successfully!")
-            print("✅ All endpoints return proper response structures!")
-            print("✅ JWT tokens are generated correctly!")
-        elif self.test_results['passed_tests'] > 0:
-            print(f"\n⚠️  Most tests passed ({self.test_results['passed_tests']}/{self.test_results['total_tests']})")
-            print("✅ Core functionality is working!")
-            print("⚠️  Some minor issues detected - check test details above")
-        else:
-            print(f"\n❌ All tests failed")
-            print("❌ Authentication system needs fixes before frontend integration")
-        
-        return self.test_results
 
-def main():
-    """Main test runner"""
-    try:
-        tester = SimpleAuthTester()
-        results = tester.run_all_tests()
-        
-        # Save detailed results to file
-        results_file = "/workspace/backend/simple_auth_test_results.json"
-        with open(results_file, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
-        
-        print(f"\n📄 Detailed results saved to: {results_file}")
-        
-        return results['failed_tests'] == 0
-        
-    except KeyboardInterrupt:
-        print("\n⏹️  Tests interrupted by user")
-        return False
-    except Exception as e:
-        print(f"\n💥 Critical error during testing: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return False
 
-if __name__ == "__main__":
-    success = main()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+def assert_frontend_structure(response_data, view_name):
+    """Check the envelope and user block the frontend reads"""
+    missing_fields = [field for field in ['status', 'message', 'user'] if field not in response_data]
+    assert not missing_fields, f"{view_name} missing required fields: {missing_fields}"
+
+    user = response_data['user']
+    missing_user_fields = [
+        field for field in ['id', 'username', 'email', 'first_name', 'last_name'] if field not in user
+    ]
+    assert not missing_user_fields, f"{view_name} user missing fields: {missing_user_fields}"
+
+
+def test_user_creation(django_user_model):
+    """Users can be created in the database and authenticate"""
+    user_count_before = django_user_model.objects.count()
+    user = django_user_model.objects.create_user(
+        username="user_creation_test",
+        email="user.creation@example.com",
+        password="TestPassword123!",
+        first_name="Creation",
+        last_name="Tester"
+    )
+
+    assert django_user_model.objects.count() > user_count_before, "User creation didn't increase database count"
+    assert user.check_password("TestPassword123!"), "Test user cannot authenticate"
+
+
+def test_login_serializer(db, test_user, login_data):
+    """LoginSerializer validates frontend data and picks the login field"""
+    serializer = LoginSerializer(data=login_data)
+
+    assert serializer.is_valid(), f"Serializer validation failed: {serializer.errors}"
+    login_field = serializer.validated_data['login_field']
+    assert login_field == test_user.username, f"Serializer picked the wrong login field: {login_field}"
+
+
+def test_register_serializer(db):
+    """RegisterSerializer validates and saves frontend data"""
+    serializer = RegisterSerializer(data={
+        "username": "new_frontend_user",
+        "email": "new.frontend@example.com",
+        "password": "NewUserPassword123!",
+        "password_confirm": "NewUserPassword123!",
+        "first_name": "New",
+        "last_name": "User",
+        "learning_style": "visual",
+        "preferred_difficulty": "intermediate"
+    })
+
+    assert serializer.is_valid(), f"RegisterSerializer validation failed: {serializer.errors}"
+    # Rolled back with the test transaction, so no cleanup is needed
+    user = serializer.save()
+    assert user.username == "new_frontend_user"
+
+
+def test_login_view_structure(post_to_view, db, test_user, login_data):
+    """LoginView returns the expected structure"""
+    response = post_to_view(LoginView, '/api/auth/login/', login_data)
+
+    assert response.status_code == 200, f"LoginView returned unexpected status: {response.status_code}"
+    assert_frontend_structure(response.data, "LoginView")
+    assert response.data['user']['username'] == test_user.username
+    assert response.data['session_active'] is True, "LoginView did not report an active session"
+
+
+def test_register_view_structure(post_to_view, db):
+    """RegisterView returns the expected structure"""
+    response = post_to_view(RegisterView, '/api/auth/register/', {
+        "username": "frontend_register_test",
+        "email": "frontend.register@example.com",
+        "password": "FrontendTest123!",
+        "password_confirm": "FrontendTest123!",
+        "first_name": "Frontend",
+        "last_name": "Register",
+        "learning_style": "auditory",
+        "preferred_difficulty": "advanced"
+    })
+
+    assert response.status_code == 201, f"RegisterView returned unexpected status: {response.status_code}"
+    assert_frontend_structure(response.data, "RegisterView")
+    assert response.data['user']['username'] == "frontend_register_test"